@@ -6,12 +6,19 @@ Provides command-line interface for managing bioinformatics workflows.
 
 import argparse
 import json
+import os
 import yaml
 import sys
 from pathlib import Path
 from typing import List, Dict, Any
 import logging
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -460,7 +467,7 @@ class WorkflowManager:
         
         # Save workflow
         with open(output_file, 'w') as f:
-            yaml.dump(workflow, f, default_flow_style=False, indent=2)
+            yaml.dump(workflow, f, Dumper=YamlDumper, default_flow_style=False, indent=2)
         
         logger.info(f"Created workflow: {output_file}")
         return str(output_file)
@@ -470,7 +477,7 @@ class WorkflowManager:
         
         try:
             with open(workflow_file, 'r') as f:
-                workflow = yaml.safe_load(f)
+                workflow = yaml.load(f, Loader=YamlLoader)
             
             # Check required fields
             required_fields = ['metadata', 'steps']
@@ -527,7 +534,7 @@ class WorkflowManager:
         
         try:
             with open(workflow_file, 'r') as f:
-                workflow = yaml.safe_load(f)
+                workflow = yaml.load(f, Loader=YamlLoader)
             
             metadata = workflow['metadata']
             steps = workflow['steps']
@@ -562,7 +569,7 @@ class WorkflowManager:
         
         try:
             with open(workflow_file, 'r') as f:
-                workflow = yaml.safe_load(f)
+                workflow = yaml.load(f, Loader=YamlLoader)
             
             # Create sample run directory
             if not output_dir:
@@ -593,7 +600,7 @@ class WorkflowManager:
             
             # Save main sample file
             with open(main_file, 'w') as f:
-                yaml.dump(sample_run, f, default_flow_style=False, indent=2)
+                yaml.dump(sample_run, f, Dumper=YamlDumper, default_flow_style=False, indent=2)
             
             # Create directory structure
             (output_dir / "inputs").mkdir(exist_ok=True)
@@ -625,11 +632,12 @@ class WorkflowManager:
             return []
         
         run_files = []
-        for run_dir in runs_dir.iterdir():
-            if run_dir.is_dir():
-                main_file = run_dir / "main_sample.yaml"
-                if main_file.exists():
-                    run_files.append(str(main_file))
+        with os.scandir(runs_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    main_file = os.path.join(entry.path, "main_sample.yaml")
+                    if os.path.exists(main_file):
+                        run_files.append(main_file)
         
         return run_files
 
@@ -7,15 +7,106 @@ import yaml
 import json
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import sys
+import re
 import hashlib
+import logging
+import subprocess
+import traceback
 import shutil
+import base64
 from django.utils import timezone
 from .models import FileUploadSession, UploadedFile, WorkflowRun
 
 # Add the orchestrator to the path
 sys.path.append('/app/workflow-orchestrator')
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+def _new_run_id() -> str:
+    """Random 64-bit run ID as 13 lowercase base32 characters, safe on case-insensitive filesystems (older IDs remain valid)"""
+    return base64.b32encode(os.urandom(8)).rstrip(b'=').decode('ascii').lower()
+
+def _load_workflow_yaml(workflow_file: Path):
+    """Load a run's workflow.yaml, via the orchestrator's workflow.json mirror while it matches the YAML file"""
+    stat = workflow_file.stat()
+    try:
+        sidecar = json.loads(workflow_file.with_suffix('.json').read_bytes())
+        if sidecar.get('source') == {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}:
+            return sidecar['workflow']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    with open(workflow_file, 'rb') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+# Threads the dashboard uses to read run status files concurrently
+RUN_READ_WORKERS = 16
+
+def _read_run_workflow_data(run_dir: Path, logger) -> dict:
+    """Read a run's status, preferring workflow_summary.json (most current) over workflow.yaml"""
+    workflow_id = run_dir.name
+    logger.info(f"🔍 Processing workflow directory: {workflow_id}")
+    
+    summary_file = run_dir / "workflow_summary.json"
+    workflow_file = run_dir / "workflow.yaml"
+    
+    workflow_data = {}
+    # Open directly rather than probing with exists() first; a missing file is just skipped
+    try:
+        with open(summary_file, 'r') as f:
+            workflow_data = json.load(f)
+        logger.info(f"✅ Read summary for {workflow_id}: {workflow_data.get('status', 'unknown')}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"❌ Error reading summary for {workflow_id}: {e}")
+    
+    # Fallback to workflow.yaml if no summary
+    if not workflow_data:
+        try:
+            workflow_data = _load_workflow_yaml(workflow_file)
+            logger.info(f"✅ Read workflow.yaml for {workflow_id}: {workflow_data.get('status', 'unknown')}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"❌ Error reading workflow.yaml for {workflow_id}: {e}")
+    return workflow_data
+
+def _completed_step_numbers(run_dir: Path, tools: list) -> list:
+    """Return the numbers of steps whose step_<n>_<tool> directory has output, listing the run directory once"""
+    try:
+        with os.scandir(run_dir) as entries:
+            step_dirs = {entry.name: entry.path for entry in entries if entry.name.startswith('step_')}
+    except FileNotFoundError:
+        return []
+    completed = []
+    for i, step_name in enumerate(tools, 1):
+        step_path = step_dirs.get(f"step_{i}_{step_name}")
+        if step_path is None:
+            continue
+        try:
+            with os.scandir(step_path) as step_entries:
+                if next(step_entries, None) is not None:
+                    completed.append(i)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    return completed
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str):
+    """Parse an ISO 8601 timestamp (trailing Z allowed), or None; memoized across dashboard polls"""
+    try:
+        # Python 3.11's C fromisoformat accepts the Z suffix directly, no rewritten copy of the string
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
 # @login_required  # Temporarily disabled for testing
 def home(request):
     """Home page view"""
@@ -25,7 +116,6 @@ def home(request):
 def dashboard(request):
     """User dashboard with workflow overview and quick actions"""
     print("🚀 Dashboard view called", flush=True)
-    import logging
     logger = logging.getLogger(__name__)
     logger.info("🚀 Dashboard view called via logging")
     stats = {
@@ -44,77 +134,56 @@ def dashboard(request):
         logger.info(f"🔍 Runs directory exists: {runs_dir.exists()}")
         
         if runs_dir.exists():
-            logger.info(f"🔍 Found {len(list(runs_dir.iterdir()))} items in runs directory")
-            for run_dir in runs_dir.iterdir():
-                if run_dir.is_dir():
-                    workflow_id = run_dir.name
-                    logger.info(f"🔍 Processing workflow directory: {workflow_id}")
-                    
-                    # Try to read workflow_summary.json first (most current status)
-                    summary_file = run_dir / "workflow_summary.json"
-                    workflow_file = run_dir / "workflow.yaml"
-                    
-                    workflow_data = {}
-                    if summary_file.exists():
-                        try:
-                            with open(summary_file, 'r') as f:
-                                workflow_data = json.load(f)
-                            logger.info(f"✅ Read summary for {workflow_id}: {workflow_data.get('status', 'unknown')}")
-                        except Exception as e:
-                            logger.error(f"❌ Error reading summary for {workflow_id}: {e}")
+            # scandir reports each entry's type from the directory listing, no stat per run
+            with os.scandir(runs_dir) as entries:
+                run_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+            logger.info(f"🔍 Found {len(run_dirs)} run directories")
+            # Read each run's status file concurrently; the per-run checks below stay in order
+            with ThreadPoolExecutor(max_workers=RUN_READ_WORKERS) as executor:
+                run_data = list(executor.map(lambda run_dir: _read_run_workflow_data(run_dir, logger), run_dirs))
+            for run_dir, workflow_data in zip(run_dirs, run_data):
+                workflow_id = run_dir.name
+                
+                if workflow_data:
+                    # Ensure we have the workflow_id
+                    workflow_data['workflow_id'] = workflow_id
                     
-                    # Fallback to workflow.yaml if no summary
-                    if not workflow_data and workflow_file.exists():
-                        try:
-                            with open(workflow_file, 'r') as f:
-                                workflow_data = yaml.safe_load(f)
-                            logger.info(f"✅ Read workflow.yaml for {workflow_id}: {workflow_data.get('status', 'unknown')}")
-                        except Exception as e:
-                            logger.error(f"❌ Error reading workflow.yaml for {workflow_id}: {e}")
+                    # Determine actual status by analyzing the file system
+                    actual_status = workflow_data.get('status', 'unknown')
+                    tools = workflow_data.get('tools', [])
+                    total_steps = len(tools) if tools else 0
                     
-                    if workflow_data:
-                        # Ensure we have the workflow_id
-                        workflow_data['workflow_id'] = workflow_id
-                        
-                        # Determine actual status by analyzing the file system
-                        actual_status = workflow_data.get('status', 'unknown')
-                        tools = workflow_data.get('tools', [])
-                        total_steps = len(tools) if tools else 0
+                    if total_steps > 0:
+                        # Count completed steps
+                        completed_steps = 0
+                        for i in _completed_step_numbers(run_dir, tools):
+                            completed_steps += 1
+                            logger.info(f"✅ Step {i} ({tools[i-1]}) completed for {workflow_id}")
                         
-                        if total_steps > 0:
-                            # Count completed steps
-                            completed_steps = 0
-                            for i in range(1, total_steps + 1):
-                                step_name = tools[i-1] if i <= len(tools) else f"step_{i}"
-                                step_path = run_dir / f"step_{i}_{step_name}"
-                                if step_path.exists() and any(step_path.iterdir()):
-                                    completed_steps += 1
-                                    logger.info(f"✅ Step {i} ({step_name}) completed for {workflow_id}")
-                            
-                            logger.info(f"🔍 {workflow_id}: {completed_steps}/{total_steps} steps completed")
-                            
-                            # Determine actual status based on step completion
-                            if completed_steps == total_steps:
-                                actual_status = 'completed'
-                                workflow_data['status'] = 'completed'
-                                logger.info(f"✅ {workflow_id}: Marked as completed")
-                            elif completed_steps > 0 and actual_status == 'running':
-                                # Some steps completed but not all - check if it's been a while
-                                # This could indicate a failure or stuck workflow
-                                actual_status = 'failed'
-                                workflow_data['status'] = 'failed'
-                                logger.info(f"⚠️ {workflow_id}: Marked as failed (incomplete)")
-                            elif completed_steps == 0 and actual_status == 'running':
-                                # No steps completed but marked as running - could be stuck
-                                actual_status = 'pending'
-                                workflow_data['status'] = 'pending'
-                                logger.info(f"⏳ {workflow_id}: Marked as pending (stuck)")
+                        logger.info(f"🔍 {workflow_id}: {completed_steps}/{total_steps} steps completed")
                         
-                        all_workflows.append(workflow_data)
-                        logger.info(f"✅ Added {workflow_id} to all_workflows list")
-                    else:
-                        logger.warning(f"❌ No workflow data found for {workflow_id}")
-        
+                        # Determine actual status based on step completion
+                        if completed_steps == total_steps:
+                            actual_status = 'completed'
+                            workflow_data['status'] = 'completed'
+                            logger.info(f"✅ {workflow_id}: Marked as completed")
+                        elif completed_steps > 0 and actual_status == 'running':
+                            # Some steps completed but not all - check if it's been a while
+                            # This could indicate a failure or stuck workflow
+                            actual_status = 'failed'
+                            workflow_data['status'] = 'failed'
+                            logger.info(f"⚠️ {workflow_id}: Marked as failed (incomplete)")
+                        elif completed_steps == 0 and actual_status == 'running':
+                            # No steps completed but marked as running - could be stuck
+                            actual_status = 'pending'
+                            workflow_data['status'] = 'pending'
+                            logger.info(f"⏳ {workflow_id}: Marked as pending (stuck)")
+                    
+                    all_workflows.append(workflow_data)
+                    logger.info(f"✅ Added {workflow_id} to all_workflows list")
+                else:
+                    logger.warning(f"❌ No workflow data found for {workflow_id}")
+    
         logger.info(f"🔍 Dashboard discovered {len(all_workflows)} workflows from file system")
         
         # Sort workflows by creation date (most recent first)
@@ -125,21 +194,13 @@ def dashboard(request):
                 logger.debug(f"Processing date for {workflow.get('workflow_id')}: {created_at} (type: {type(created_at)})")
                 
                 if isinstance(created_at, str):
-                    try:
-                        # Handle different date formats
-                        if 'T' in created_at:
-                            # ISO format: 2025-08-30T20:20:18.437632
-                            parsed_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                            logger.debug(f"Parsed ISO date: {parsed_date}")
-                            return parsed_date
-                        else:
-                            # Other formats, try to parse
-                            parsed_date = datetime.fromisoformat(created_at)
-                            logger.debug(f"Parsed other date: {parsed_date}")
-                            return parsed_date
-                    except Exception as e:
-                        logger.error(f"Error parsing date '{created_at}' for workflow {workflow.get('workflow_id')}: {e}")
+                    # ISO format: 2025-08-30T20:20:18.437632
+                    parsed_date = _parse_iso_datetime(created_at)
+                    if parsed_date is None:
+                        logger.error(f"Error parsing date '{created_at}' for workflow {workflow.get('workflow_id')}")
                         return datetime.now()
+                    logger.debug(f"Parsed ISO date: {parsed_date}")
+                    return parsed_date
                 elif isinstance(created_at, datetime):
                     logger.debug(f"Already datetime: {created_at}")
                     return created_at
@@ -157,7 +218,6 @@ def dashboard(request):
             logger.info(f"🔍 Successfully sorted {len(all_workflows)} workflows by date")
         except Exception as e:
             logger.error(f"❌ Error sorting workflows: {e}")
-            import traceback
             logger.error(f"❌ Traceback: {traceback.format_exc()}")
             # Continue without sorting
         
@@ -197,12 +257,9 @@ def dashboard(request):
             logger.info(f"🔍 Tool names extracted: {tool_names}")
             
             # Parse creation date
-            try:
-                if isinstance(created_at, str):
-                    created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                else:
-                    created_at = datetime.now()
-            except:
+            if isinstance(created_at, str):
+                created_at = _parse_iso_datetime(created_at) or datetime.now()
+            else:
                 created_at = datetime.now()
             
             # Calculate progress based on actual step completion
@@ -215,11 +272,7 @@ def dashboard(request):
                 total_steps = len(tool_names) if tool_names else 0
                 
                 if step_dir.exists() and total_steps > 0:
-                    for i in range(1, total_steps + 1):
-                        step_name = tool_names[i-1] if i <= len(tool_names) else f"step_{i}"
-                        step_path = step_dir / f"step_{i}_{step_name}"
-                        if step_path.exists() and any(step_path.iterdir()):
-                            completed_steps += 1
+                    completed_steps = len(_completed_step_numbers(step_dir, tool_names))
                     
                     if total_steps > 0:
                         progress = int((completed_steps / total_steps) * 100)
@@ -260,7 +313,6 @@ def dashboard(request):
     except Exception as e:
         print(f"❌ Error fetching file-based data: {e}")
         print(f"❌ Error type: {type(e).__name__}")
-        import traceback
         traceback.print_exc()
         print("❌ End of error traceback")
     
@@ -268,7 +320,6 @@ def dashboard(request):
     print(f"📋 Final recent_activities count: {len(recent_activities)}")
     
     # Add tools path to sys.path
-    import sys
     sys.path.append('/app')
     from tools.views import scan_tools_directory
     available_tools = scan_tools_directory()
@@ -287,7 +338,6 @@ def dashboard(request):
 def workflow_list_json(request):
     """Return workflow list as JSON for dashboard expansion"""
     try:
-        import sys
         sys.path.append('/app/workflow-orchestrator')
         from orchestrator import WorkflowOrchestrator
         
@@ -298,76 +348,74 @@ def workflow_list_json(request):
         runs_dir = Path("/app/data/runs")
         
         if runs_dir.exists():
-            for run_dir in runs_dir.iterdir():
-                if run_dir.is_dir():
-                    workflow_id = run_dir.name
-                    
-                    # Try to read workflow_summary.json first (most current status)
-                    summary_file = run_dir / "workflow_summary.json"
-                    workflow_file = run_dir / "workflow.yaml"
-                    
-                    workflow_data = {}
-                    if summary_file.exists():
-                        try:
-                            with open(summary_file, 'r') as f:
-                                workflow_data = json.load(f)
-                        except Exception as e:
-                            print(f"Error reading summary for {workflow_id}: {e}")
+            with os.scandir(runs_dir) as entries:
+                run_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+            for run_dir in run_dirs:
+                workflow_id = run_dir.name
+                
+                # Try to read workflow_summary.json first (most current status)
+                summary_file = run_dir / "workflow_summary.json"
+                workflow_file = run_dir / "workflow.yaml"
+                
+                workflow_data = {}
+                try:
+                    with open(summary_file, 'r') as f:
+                        workflow_data = json.load(f)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    print(f"Error reading summary for {workflow_id}: {e}")
+                
+                # Fallback to workflow.yaml if no summary
+                if not workflow_data:
+                    try:
+                        workflow_data = _load_workflow_yaml(workflow_file)
+                    except FileNotFoundError:
+                        pass
+                    except Exception as e:
+                        print(f"Error reading workflow for {workflow_id}: {e}")
+                
+                if workflow_data:
+                    # Ensure we have the workflow_id
+                    workflow_data['workflow_id'] = workflow_id
                     
-                    # Fallback to workflow.yaml if no summary
-                    if not workflow_data and workflow_file.exists():
-                        try:
-                            with open(workflow_file, 'r') as f:
-                                workflow_data = yaml.safe_load(f)
-                        except Exception as e:
-                            print(f"Error reading workflow for {workflow_id}: {e}")
+                    # Determine actual status by analyzing the file system
+                    actual_status = workflow_data.get('status', 'unknown')
+                    tools = workflow_data.get('tools', [])
+                    total_steps = len(tools) if tools else 0
                     
-                    if workflow_data:
-                        # Ensure we have the workflow_id
-                        workflow_data['workflow_id'] = workflow_id
-                        
-                        # Determine actual status by analyzing the file system
-                        actual_status = workflow_data.get('status', 'unknown')
-                        tools = workflow_data.get('tools', [])
-                        total_steps = len(tools) if tools else 0
+                    if total_steps > 0:
+                        # Count completed steps
+                        completed_steps = len(_completed_step_numbers(run_dir, tools))
                         
+                        # Determine actual status based on step completion
+                        if completed_steps == total_steps:
+                            actual_status = 'completed'
+                            workflow_data['status'] = 'completed'
+                        elif completed_steps > 0 and actual_status == 'running':
+                            # Some steps completed but not all - check if it's been a while
+                            # This could indicate a failure or stuck workflow
+                            actual_status = 'failed'
+                            workflow_data['status'] = 'failed'
+                        elif completed_steps == 0 and actual_status == 'running':
+                            # No steps completed but marked as running - could be stuck
+                            actual_status = 'pending'
+                            workflow_data['status'] = 'pending'
+                    
+                    # Calculate progress
+                    if actual_status == 'completed':
+                        progress = 100
+                    elif actual_status == 'running':
                         if total_steps > 0:
-                            # Count completed steps
-                            completed_steps = 0
-                            for i in range(1, total_steps + 1):
-                                step_name = tools[i-1] if i <= len(tools) else f"step_{i}"
-                                step_path = run_dir / f"step_{i}_{step_name}"
-                                if step_path.exists() and any(step_path.iterdir()):
-                                    completed_steps += 1
-                            
-                            # Determine actual status based on step completion
-                            if completed_steps == total_steps:
-                                actual_status = 'completed'
-                                workflow_data['status'] = 'completed'
-                            elif completed_steps > 0 and actual_status == 'running':
-                                # Some steps completed but not all - check if it's been a while
-                                # This could indicate a failure or stuck workflow
-                                actual_status = 'failed'
-                                workflow_data['status'] = 'failed'
-                            elif completed_steps == 0 and actual_status == 'running':
-                                # No steps completed but marked as running - could be stuck
-                                actual_status = 'pending'
-                                workflow_data['status'] = 'pending'
-                        
-                        # Calculate progress
-                        if actual_status == 'completed':
-                            progress = 100
-                        elif actual_status == 'running':
-                            if total_steps > 0:
-                                progress = int((completed_steps / total_steps) * 100)
-                            else:
-                                progress = 50
+                            progress = int((completed_steps / total_steps) * 100)
                         else:
-                            progress = 0
-                        
-                        workflow_data['progress'] = progress
-                        all_workflows.append(workflow_data)
-        
+                            progress = 50
+                    else:
+                        progress = 0
+                    
+                    workflow_data['progress'] = progress
+                    all_workflows.append(workflow_data)
+    
         return JsonResponse({
             'success': True,
             'workflows': all_workflows,
@@ -492,9 +540,6 @@ def create_workflow(request):
         if workflow_name and selected_tools:
             try:
                 # Store the workflow definition in a simple JSON file
-                import os
-                from datetime import datetime
-                
                 # Create workflows directory if it doesn't exist
                 workflows_dir = Path("data/workflows")
                 workflows_dir.mkdir(parents=True, exist_ok=True)
@@ -773,7 +818,6 @@ def workflow_list(request):
     except Exception as e:
         messages.error(request, f'Error loading workflow templates: {str(e)}')
         print(f"Workflow template list error: {e}")
-        import traceback
         traceback.print_exc()
         return render(request, 'bioframe/workflow_list.html', {'workflows': []})
 
@@ -790,8 +834,7 @@ def workflow_detail(request, workflow_id):
         # Read workflow status from workflow.yaml file
         workflow_file = run_dir / "workflow.yaml"
         if workflow_file.exists():
-            with open(workflow_file, 'r') as f:
-                workflow_status = yaml.safe_load(f)
+            workflow_status = _load_workflow_yaml(workflow_file)
         else:
             workflow_status = None
         
@@ -814,17 +857,12 @@ def workflow_status_api(request, workflow_id):
     """API endpoint to get real-time workflow status and logs"""
     try:
         # Simple status check without orchestrator dependency
-        from pathlib import Path
-        import yaml
-        import json
-        
         # Get workflow info from YAML file
         workflow_file = Path(f'data/runs/{workflow_id}/workflow.yaml')
         if not workflow_file.exists():
             return JsonResponse({'error': 'Workflow not found'}, status=404)
         
-        with open(workflow_file, 'r') as f:
-            workflow_data = yaml.safe_load(f)
+        workflow_data = _load_workflow_yaml(workflow_file)
         
         # Basic status response
         status_data = {
@@ -1022,10 +1060,7 @@ def render_file_based_workflow_detail(request, workflow_status, workflow_id):
         except (ValueError, OSError):
             created_at = datetime.now()
     elif isinstance(created_at, str):
-        try:
-            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-        except ValueError:
-            created_at = datetime.now()
+        created_at = _parse_iso_datetime(created_at) or datetime.now()
     elif not isinstance(created_at, datetime):
         created_at = datetime.now()
     
@@ -1036,10 +1071,7 @@ def render_file_based_workflow_detail(request, workflow_status, workflow_id):
         except (ValueError, OSError):
             updated_at = created_at
     elif isinstance(updated_at, str):
-        try:
-            updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-        except ValueError:
-            updated_at = created_at
+        updated_at = _parse_iso_datetime(updated_at) or created_at
     elif not isinstance(updated_at, datetime):
         updated_at = created_at
     
@@ -1098,7 +1130,6 @@ def create_workflow_for_run(request, run_id):
         
         if workflow_name and selected_tools:
             try:
-                import sys
                 sys.path.append('/app/workflow-orchestrator')
                 from orchestrator import WorkflowOrchestrator
                 orchestrator = WorkflowOrchestrator(data_dir="data", init_docker=False)
@@ -1122,8 +1153,6 @@ def create_workflow_for_run(request, run_id):
 @login_required
 def initialize_workflow_run(request, template_id):
     """Initialize a workflow run with enhanced file upload tracking"""
-    from pathlib import Path
-    import json
     try:
         # First, try to find a pre-created workflow template
         workflow_templates = [
@@ -1296,7 +1325,6 @@ def initialize_workflow_run(request, template_id):
                 # If still not found, try the orchestrator (for backward compatibility)
                 if not selected_template:
                     try:
-                        import sys
                         sys.path.append('/app/workflow-orchestrator')
                         from orchestrator import WorkflowOrchestrator
                         orchestrator = WorkflowOrchestrator(data_dir="data", init_docker=False)
@@ -1390,7 +1418,6 @@ def initialize_workflow_run(request, template_id):
                         messages.error(request, 'Please upload at least one primary input file')
                     else:
                         # Create a new workflow run ID based on the template and timestamp
-                        from datetime import datetime
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         workflow_run_id = f"{template_id}_{timestamp}"
                         
@@ -1501,8 +1528,7 @@ def start_workflow_with_upload(request, template_id):
                 return JsonResponse({'success': False, 'error': 'No files provided'})
             
             # Create a unique run ID
-            import uuid
-            run_id = str(uuid.uuid4())
+            run_id = _new_run_id()
             
             # Create run directory
             run_dir = Path(f"/app/data/runs/{run_id}")
@@ -1688,31 +1714,31 @@ def validate_and_start_workflow(request, run_id):
         # Create workflow configuration with template tools
         # Normalize tool names to lowercase for orchestrator compatibility
         normalized_tools = [tool.lower() for tool in template_tools]
+        created_at = datetime.now().isoformat()
         
         workflow_config = {
             'workflow_name': template_name,
             'description': f'Workflow run {run_id}',
             'tools': normalized_tools,
-            'created_at': datetime.now().isoformat()
+            'created_at': created_at
         }
         
         # Save workflow configuration
         workflow_file = run_dir / "workflow.yaml"
         with open(workflow_file, 'w') as f:
-            yaml.dump(workflow_config, f, default_flow_style=False)
+            yaml.dump(workflow_config, f, Dumper=YamlDumper, default_flow_style=False)
         
         # Create workflow execution trigger file for orchestrator service to pick up
         trigger_file = run_dir / "execute_workflow.trigger"
         with open(trigger_file, 'w') as f:
             f.write(f"Workflow ready for execution: {run_id}\n")
-            f.write(f"Created at: {datetime.now().isoformat()}\n")
+            f.write(f"Created at: {created_at}\n")
         
         # Update workflow status to indicate it's ready for execution
         workflow_config['status'] = 'ready_for_execution'
-        workflow_config['created_at'] = datetime.now().isoformat()
         
         with open(workflow_file, 'w') as f:
-            yaml.dump(workflow_config, f, default_flow_style=False)
+            yaml.dump(workflow_config, f, Dumper=YamlDumper, default_flow_style=False)
         
         return JsonResponse({
             'success': True,
@@ -1728,9 +1754,6 @@ def validate_and_start_workflow(request, run_id):
 def get_running_containers(request, workflow_id):
     """Get running containers for a workflow"""
     try:
-        import subprocess
-        import json
-        
         print(f"🔍 Getting running containers for workflow: {workflow_id}")
         
         # Get all running containers with bioframe prefix
@@ -1784,8 +1807,6 @@ def get_running_containers(request, workflow_id):
 def get_container_logs(request, workflow_id, container_id):
     """Get logs for a specific container"""
     try:
-        import subprocess
-        
         print(f"🔍 Getting real logs for container: {container_id}")
         
         # Use the simple docker logs command that works
@@ -2002,7 +2023,6 @@ def download_workflow_file(request, workflow_id):
 def rerun_workflow(request, workflow_id):
     """Rerun a workflow from the beginning"""
     try:
-        import sys
         sys.path.append('/app/workflow-orchestrator')
         from orchestrator import WorkflowOrchestrator
         orchestrator = WorkflowOrchestrator(data_dir="/app/data", init_docker=False)
@@ -2014,8 +2034,6 @@ def rerun_workflow(request, workflow_id):
             return redirect('workflow_list')
         
         # Create a new run ID for the rerun
-        import uuid
-        from datetime import datetime
         new_run_id = f"rerun_{workflow_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Get the original input files
@@ -2074,7 +2092,6 @@ def rerun_workflow(request, workflow_id):
 def rerun_workflow_from_step(request, workflow_id, step_number):
     """Rerun a workflow from a specific step"""
     try:
-        import sys
         sys.path.append('/app/workflow-orchestrator')
         from orchestrator import WorkflowOrchestrator
         orchestrator = WorkflowOrchestrator(data_dir="/app/data", init_docker=False)
@@ -2086,8 +2103,6 @@ def rerun_workflow_from_step(request, workflow_id, step_number):
             return redirect('workflow_list')
         
         # Create a new run ID for the rerun
-        import uuid
-        from datetime import datetime
         new_run_id = f"rerun_step{step_number}_{workflow_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Get the original input files
@@ -2149,10 +2164,6 @@ def rerun_workflow_from_step(request, workflow_id, step_number):
 def get_tool_logs(request, workflow_id, tool_name):
     """Get comprehensive orchestrator logs and analysis for a specific tool"""
     try:
-        from django.http import JsonResponse
-        import json
-        from datetime import datetime
-        
         # Construct path to workflow run directory
         run_dir = Path(f"/app/data/runs/{workflow_id}")
         if not run_dir.exists():
@@ -2175,7 +2186,6 @@ def get_tool_logs(request, workflow_id, tool_name):
         
         # Check for running containers and get their logs
         try:
-            import subprocess
             result = subprocess.run(
                 ['docker', 'ps', '--filter', f'name={workflow_id}', '--format', 'json'],
                 capture_output=True, text=True
@@ -2468,7 +2478,6 @@ def get_tool_logs(request, workflow_id, tool_name):
 
 def extract_step_number(message):
     """Extract step number from log message"""
-    import re
     match = re.search(r'STEP (\d+)', message)
     return int(match.group(1)) if match else 0
 
@@ -2476,8 +2485,6 @@ def extract_step_number(message):
 def get_tool_log_file(request, workflow_id, tool_name):
     """Get the actual tool log file content (e.g., spades.log, trimmomatic.log)"""
     try:
-        from django.http import JsonResponse
-        
         # Construct path to workflow run
         run_dir = Path(f"/app/data/runs/{workflow_id}")
         if not run_dir.exists():
@@ -2556,8 +2563,6 @@ def get_tool_log_file(request, workflow_id, tool_name):
 def get_workflow_issues_log(request, workflow_id):
     """Get comprehensive workflow issues and failures log"""
     try:
-        from django.http import JsonResponse
-        
         run_dir = Path(f"/app/data/runs/{workflow_id}")
         if not run_dir.exists():
             return JsonResponse({'success': False, 'error': 'Workflow run not found'})
@@ -2612,8 +2617,6 @@ def get_workflow_issues_log(request, workflow_id):
 def download_workflow_issues_log(request, workflow_id):
     """Download the workflow issues log file"""
     try:
-        from django.http import HttpResponse
-        
         run_dir = Path(f"/app/data/runs/{workflow_id}")
         if not run_dir.exists():
             return HttpResponse('Workflow run not found', status=404)
@@ -2643,6 +2646,8 @@ def download_workflow_issues_log(request, workflow_id):
 def analyze_workflow_for_issues(workflow_id, run_dir):
     """Analyze workflow logs and files to detect issues"""
     issues = []
+    # One timestamp for the whole pass, shared by every issue it reports
+    analyzed_at = datetime.now().isoformat()
     
     try:
         # Check for workflow completion status
@@ -2664,7 +2669,7 @@ def analyze_workflow_for_issues(workflow_id, run_dir):
                 
                 if completed_steps < expected_steps:
                     issues.append({
-                        'timestamp': datetime.now().isoformat(),
+                        'timestamp': analyzed_at,
                         'issue_type': 'WORKFLOW_INCOMPLETE',
                         'severity': 'WARNING',
                         'message': f'Workflow appears to be incomplete - only {completed_steps}/{expected_steps} steps completed',
@@ -2686,7 +2691,7 @@ def analyze_workflow_for_issues(workflow_id, run_dir):
                     error_content = f.read()
                     if error_content.strip():
                         issues.append({
-                            'timestamp': datetime.now().isoformat(),
+                            'timestamp': analyzed_at,
                             'issue_type': 'ERROR_LOG_DETECTED',
                             'severity': 'ERROR',
                             'message': 'Error log contains error messages',
@@ -2706,7 +2711,7 @@ def analyze_workflow_for_issues(workflow_id, run_dir):
                     if 'STEP 1' in detailed_content and 'STEP 2' in detailed_content:
                         if 'STEP 3' not in detailed_content and expected_steps >= 3:
                             issues.append({
-                                'timestamp': datetime.now().isoformat(),
+                                'timestamp': analyzed_at,
                                 'issue_type': 'EXECUTION_INCOMPLETE',
                                 'severity': 'WARNING',
                                 'message': 'Workflow execution appears to have stopped after step 2',
@@ -2728,7 +2733,7 @@ def analyze_workflow_for_issues(workflow_id, run_dir):
                 files = list(step_dir.glob('*'))
                 if len(files) < 2:  # Most tools should produce at least 2 files
                     issues.append({
-                        'timestamp': datetime.now().isoformat(),
+                        'timestamp': analyzed_at,
                         'issue_type': 'STEP_OUTPUT_INSUFFICIENT',
                         'severity': 'WARNING',
                         'message': f'Step {step_number} ({tool_name}) produced very few output files',
@@ -2752,7 +2757,7 @@ def analyze_workflow_for_issues(workflow_id, run_dir):
                     if lines and not lines[-1].strip():
                         # Last line is empty, might indicate abrupt stop
                         issues.append({
-                            'timestamp': datetime.now().isoformat(),
+                            'timestamp': analyzed_at,
                             'issue_type': 'LOGGING_ABRUPT_STOP',
                             'severity': 'WARNING',
                             'message': 'Workflow logging appears to have stopped abruptly',
@@ -2771,7 +2776,7 @@ def analyze_workflow_for_issues(workflow_id, run_dir):
         
         if total_size > 10 * 1024 * 1024 * 1024:  # 10GB
             issues.append({
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': analyzed_at,
                 'issue_type': 'LARGE_WORKFLOW_OUTPUT',
                 'severity': 'INFO',
                 'message': 'Workflow output is very large',
@@ -2783,7 +2788,7 @@ def analyze_workflow_for_issues(workflow_id, run_dir):
         
     except Exception as e:
         issues.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': analyzed_at,
             'issue_type': 'ISSUE_ANALYSIS_ERROR',
             'severity': 'ERROR',
             'message': f'Error during issue analysis: {str(e)}',
@@ -2902,10 +2907,6 @@ def save_issues_log(workflow_id, run_dir, issues):
 def get_container_status(request, workflow_id):
     """Get real-time container status for a workflow"""
     try:
-        import subprocess
-        import json
-        from datetime import datetime
-        
         # Get all containers for this workflow
         result = subprocess.run([
             'docker', 'ps', '--all', '--filter', f'name={workflow_id}', '--format', 
@@ -2972,9 +2973,6 @@ def get_container_status(request, workflow_id):
 def get_workflow_files(request, workflow_id):
     """Get list of files generated by workflow"""
     try:
-        import os
-        from pathlib import Path
-        
         # Get workflow run directory
         run_dir = Path(f'data/runs/{workflow_id}')
         files = []
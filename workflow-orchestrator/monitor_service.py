@@ -7,12 +7,19 @@ Monitors for workflow trigger files and executes workflows automatically
 import os
 import time
 import json
-import yaml
 from pathlib import Path
 from datetime import datetime
 import logging
+import threading
 from orchestrator import WorkflowOrchestrator
 
+# Optional: filesystem events wake the monitor as soon as a run is triggered
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +27,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger("workflow_monitor")
 
+# Seconds between scans when polling is the only way to notice new triggers
+POLL_INTERVAL = 5
+
+# Seconds between safety-net scans while filesystem events are delivered
+WATCHED_POLL_INTERVAL = 60
+
+# File names whose creation or replacement can make a run ready for execution
+WAKEUP_FILES = frozenset({"execute_workflow.trigger", "workflow.yaml"})
+
+if Observer is not None:
+    class TriggerEventHandler(FileSystemEventHandler):
+        """Wakes the monitor loop when a run's trigger file or workflow.yaml changes"""
+        
+        def __init__(self, wakeup: threading.Event, observer, runs_dir: Path):
+            super().__init__()
+            self.wakeup = wakeup
+            self.observer = observer
+            self.runs_dir = os.path.abspath(runs_dir)
+            # Non-recursive watch per run directory, so step outputs deep in a run never raise events
+            self.run_watches = {}
+        
+        def watch_runs_dir(self):
+            """Watch runs/ itself plus every run directory already in it"""
+            self.observer.schedule(self, self.runs_dir, recursive=False)
+            with os.scandir(self.runs_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        self.watch_run(entry.path)
+        
+        def watch_run(self, run_path: str):
+            """Add a non-recursive watch on one run directory"""
+            if run_path in self.run_watches:
+                return
+            try:
+                self.run_watches[run_path] = self.observer.schedule(self, run_path, recursive=False)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not watch {run_path}: {e}")
+        
+        def unwatch_run(self, run_path: str):
+            """Drop the watch of a run directory that was removed or moved away"""
+            watch = self.run_watches.pop(run_path, None)
+            if watch is not None:
+                try:
+                    self.observer.unschedule(watch)
+                except KeyError:
+                    pass
+        
+        def on_any_event(self, event):
+            src_path = os.fsdecode(event.src_path)
+            # The orchestrator replaces workflow.yaml by rename, so check the move destination too
+            dest_path = os.fsdecode(getattr(event, 'dest_path', '') or '')
+            if event.is_directory:
+                # Only direct children of runs/ are runs; anything deeper is covered by the run's scan
+                if os.path.dirname(src_path) == self.runs_dir and event.event_type in ('deleted', 'moved'):
+                    self.unwatch_run(src_path)
+                if event.event_type in ('created', 'moved'):
+                    new_path = dest_path or src_path
+                    if os.path.dirname(new_path) == self.runs_dir:
+                        self.watch_run(new_path)
+                        # The trigger may have landed before the watch existed, so rescan now
+                        self.wakeup.set()
+                return
+            if os.path.basename(dest_path or src_path) in WAKEUP_FILES:
+                self.wakeup.set()
+
 class WorkflowMonitor:
     """Monitors for workflow trigger files and executes workflows"""
     
@@ -28,6 +100,8 @@ class WorkflowMonitor:
         self.runs_dir = self.data_dir / "runs"
         self.orchestrator = WorkflowOrchestrator(data_dir, init_docker=True)
         self.processed_triggers = set()
+        # Set by filesystem events to cut the wait before the next scan short
+        self._wakeup = threading.Event()
         
         logger.info("🔍 Workflow Monitor initialized")
         logger.info(f"📁 Monitoring directory: {self.runs_dir}")
@@ -36,54 +110,83 @@ class WorkflowMonitor:
         """Main monitoring loop"""
         logger.info("🚀 Starting workflow monitoring service...")
         
+        observer = self._start_observer()
+        poll_interval = WATCHED_POLL_INTERVAL if observer else POLL_INTERVAL
+        
         while True:
             try:
+                # Clear before scanning so an event arriving mid-scan triggers another pass
+                self._wakeup.clear()
                 self._check_for_new_workflows()
-                time.sleep(5)  # Check every 5 seconds
+                self._wakeup.wait(poll_interval)
             except KeyboardInterrupt:
                 logger.info("🛑 Monitoring service stopped by user")
                 break
             except Exception as e:
                 logger.error(f"❌ Error in monitoring loop: {e}")
                 time.sleep(10)  # Wait longer on error
+        
+        if observer:
+            observer.stop()
+            observer.join()
+    
+    def _start_observer(self):
+        """Watch the runs directory for trigger files, or return None to fall back to polling"""
+        if Observer is None:
+            logger.info(f"⏱️ watchdog not installed, polling every {POLL_INTERVAL}s")
+            return None
+        try:
+            self.runs_dir.mkdir(parents=True, exist_ok=True)
+            observer = Observer()
+            TriggerEventHandler(self._wakeup, observer, self.runs_dir).watch_runs_dir()
+            observer.daemon = True
+            observer.start()
+            logger.info(f"👀 Watching {self.runs_dir} for workflow triggers")
+            return observer
+        except Exception as e:
+            logger.warning(f"⚠️ Could not watch {self.runs_dir}, polling every {POLL_INTERVAL}s: {e}")
+            return None
     
     def _check_for_new_workflows(self):
         """Check for new workflow trigger files and resume stuck workflows"""
-        if not self.runs_dir.exists():
+        try:
+            # scandir's cached d_type answers is_dir() without a stat per run on each poll
+            with os.scandir(self.runs_dir) as entries:
+                run_ids = [entry.name for entry in entries
+                           if entry.name not in self.processed_triggers and entry.is_dir()]
+        except FileNotFoundError:
             return
             
-        for run_dir in self.runs_dir.iterdir():
-            if not run_dir.is_dir():
-                continue
-                
-            run_id = run_dir.name
+        for run_id in run_ids:
+            run_dir = self.runs_dir / run_id
             trigger_file = run_dir / "execute_workflow.trigger"
             
-            # Skip if already processed or no trigger file
-            if run_id in self.processed_triggers or not trigger_file.exists():
+            # Skip if no trigger file
+            if not trigger_file.exists():
                 continue
             
-            # Check if workflow is ready for execution
-            workflow_file = run_dir / "workflow.yaml"
-            if not workflow_file.exists():
-                logger.warning(f"⚠️ No workflow.yaml found for {run_id}")
-                continue
-            
-            # Load workflow configuration
+            # Load workflow configuration (reparsed only when the file changes between polls);
+            # the loader's own stat doubles as the existence check
             try:
-                with open(workflow_file, 'r') as f:
-                    workflow_config = yaml.safe_load(f)
+                try:
+                    workflow_config = self.orchestrator._load_workflow_file(run_id)
+                except FileNotFoundError:
+                    logger.warning(f"⚠️ No workflow.yaml found for {run_id}")
+                    continue
                 
+                # Check if workflow is ready for execution
                 if workflow_config.get('status') != 'ready_for_execution':
                     continue
                     
                 logger.info(f"🎯 Found new workflow to execute: {run_id}")
                 
                 # Get input files
-                input_dir = run_dir / "inputs"
                 input_files = []
-                if input_dir.exists():
-                    input_files = [str(f) for f in input_dir.iterdir() if f.is_file()]
+                try:
+                    with os.scandir(run_dir / "inputs") as entries:
+                        input_files = [entry.path for entry in entries if entry.is_file()]
+                except FileNotFoundError:
+                    pass
                 
                 if not input_files:
                     logger.warning(f"⚠️ No input files found for {run_id}")
@@ -100,8 +203,6 @@ class WorkflowMonitor:
     
     def _execute_workflow_async(self, run_id: str, input_files: list, workflow_config: dict):
         """Execute workflow asynchronously"""
-        import threading
-        
         def execute():
             try:
                 logger.info(f"🚀 Starting execution of workflow: {run_id}")
@@ -110,9 +211,7 @@ class WorkflowMonitor:
                 workflow_config['status'] = 'running'
                 workflow_config['started_at'] = datetime.now().isoformat()
                 
-                workflow_file = self.runs_dir / run_id / "workflow.yaml"
-                with open(workflow_file, 'w') as f:
-                    yaml.dump(workflow_config, f, default_flow_style=False)
+                self.orchestrator._save_workflow_file(run_id, workflow_config)
                 
                 # Execute the workflow
                 success = self.orchestrator.execute_pipeline_workflow_enhanced(
@@ -121,20 +220,17 @@ class WorkflowMonitor:
                     workflow_config=workflow_config
                 )
                 
-                # Update final status
+                # A successful run has already recorded its completed status and execution time;
+                # a failed step leaves the status to us, so update the file as execution left it
                 if success:
-                    workflow_config['status'] = 'completed'
-                    workflow_config['completed_at'] = datetime.now().isoformat()
                     logger.info(f"✅ Workflow {run_id} completed successfully")
                 else:
-                    workflow_config['status'] = 'failed'
-                    workflow_config['failed_at'] = datetime.now().isoformat()
+                    workflow = self.orchestrator._load_workflow_file(run_id)
+                    workflow['status'] = 'failed'
+                    workflow['failed_at'] = datetime.now().isoformat()
+                    self.orchestrator._save_workflow_file(run_id, workflow)
                     logger.error(f"❌ Workflow {run_id} failed")
                 
-                # Save final status
-                with open(workflow_file, 'w') as f:
-                    yaml.dump(workflow_config, f, default_flow_style=False)
-                
                 # Remove trigger file
                 trigger_file = self.runs_dir / run_id / "execute_workflow.trigger"
                 if trigger_file.exists():
@@ -149,9 +245,7 @@ class WorkflowMonitor:
                     workflow_config['failed_at'] = datetime.now().isoformat()
                     workflow_config['error'] = str(e)
                     
-                    workflow_file = self.runs_dir / run_id / "workflow.yaml"
-                    with open(workflow_file, 'w') as f:
-                        yaml.dump(workflow_config, f, default_flow_style=False)
+                    self.orchestrator._save_workflow_file(run_id, workflow_config)
                 except:
                     pass
         
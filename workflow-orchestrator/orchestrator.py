@@ -5,37 +5,298 @@ Manages the execution of bioinformatics workflows
 """
 
 import os
+import re
 import json
 import yaml
 import time
+import shlex
 import shutil
+import sqlite3
+import graphlib
+import hashlib
+import mmap
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
 from typing import Dict, Any, List, Optional, Tuple
-import uuid
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from datetime import datetime
 import subprocess
 import logging
+from logging.handlers import QueueHandler
 import traceback
 import threading
 import queue
-import psutil
-import signal
+from collections import Counter, deque
+import orjson
 import sys
+import atexit
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# Docker SDK, imported on first use: it pulls in requests/urllib3 and the portal runs with init_docker=False
+docker = None
+
+# SIMD/multithreaded BLAKE3 for step cache input fingerprints when installed
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# ioctl() for copy-on-write file clones; POSIX only
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 # Import the new dynamic logging system
-from logging_utils import DynamicWorkflowLogger
+from logging_utils import (
+    DynamicWorkflowLogger, DeferredFlushStreamHandler, BatchFlushQueueListener, format_crash_stack_trace
+)
+
+# Module logger; WorkflowOrchestrator attaches its handlers to this same logger
+logger = logging.getLogger("orchestrator")
+
+# Console listener behind the module logger's queue handler, started once per process
+_console_log_lock = threading.Lock()
+_console_log_listener: Optional[BatchFlushQueueListener] = None
+
+def _start_console_logging():
+    """Attach the queue handler and console listener to the module logger on first use"""
+    global _console_log_listener
+    with _console_log_lock:
+        if _console_log_listener is not None:
+            return
+        
+        # Console handler (flushed once per drained batch of records)
+        console_handler = DeferredFlushStreamHandler()
+        console_handler.setLevel(logging.INFO)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        console_handler.setFormatter(formatter)
+        
+        # Hot paths (e.g. per-line container output) only enqueue records
+        log_queue = queue.SimpleQueue()
+        _console_log_listener = BatchFlushQueueListener(log_queue, console_handler, respect_handler_level=True)
+        _console_log_listener.start()
+        logger.addHandler(QueueHandler(log_queue))
+        # Stopping the listener at exit writes out any records still queued
+        atexit.register(_console_log_listener.stop)
+
+# Matches template placeholders such as {input_file_1} or {output_dir}
+TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r"\{[A-Za-z0-9_]+\}")
+
+# Block size for reading container stdout/stderr pipes
+PIPE_READ_SIZE = 1 << 16
+
+# Trailing stdout/stderr lines kept in a step's result; the full streams go to the run's logs/
+CAPTURED_OUTPUT_TAIL_LINES = 1000
+
+# Tools assumed installed when the image listing fails; their images are also warmed at startup
+DEFAULT_TOOLS = ("fastqc", "trimmomatic", "spades", "quast", "multiqc")
+
+# Short, frequently repeated tools whose steps run via docker exec in a per-workflow container
+POOLED_TOOLS = frozenset({"fastqc", "multiqc", "samtools", "seqtk"})
+
+# Minimum {threads} value for tool commands; concurrent steps share any CPUs beyond it
+DEFAULT_TOOL_THREADS = 4
+
+# Host data directory shared with tool containers as /data (and read-only as /host-data);
+# docker-compose passes the host project directory as BIOFRAME_HOST_PATH
+HOST_DATA_PATH = (
+    f"{os.environ['BIOFRAME_HOST_PATH'].rstrip('/')}/data" if os.environ.get("BIOFRAME_HOST_PATH")
+    else None
+)
+
+
+def _host_data_path() -> str:
+    """Host path of the data directory for tool container mounts; fails clearly when unconfigured"""
+    if HOST_DATA_PATH is None:
+        raise RuntimeError(
+            "BIOFRAME_HOST_PATH is not set: it must name the BioFrame project directory on the "
+            "Docker host so tool containers can mount its data/ directory"
+        )
+    return HOST_DATA_PATH
+
+# Inputs larger than this are fingerprinted by size and mtime instead of content
+STAT_FINGERPRINT_THRESHOLD = 10 << 30
+
+# Tool config keys that vary per run and must not affect step cache keys
+STEP_CACHE_IGNORED_CONFIG = frozenset({"step_number", "workflow_id"})
+
+# orjson options for the step result, rerun and summary JSON files
+JSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Directories never listed as run outputs, at any depth (dot-directories are skipped as well)
+OUTPUT_SCAN_SKIP_DIRS = frozenset({"__pycache__"})
+
+# Run-root directories not listed as outputs; the run's logs/ is reported separately by _get_log_files
+OUTPUT_SCAN_SKIP_ROOT_DIRS = frozenset({"logs"})
+
+# Orchestrator bookkeeping in the run root: the workflow.json mirror and checkpoint log, plus the
+# temp-file prefixes _save_workflow_file and _write_workflow_sidecar write beside their targets before renaming
+OUTPUT_SCAN_SKIP_ROOT_FILES = frozenset({"workflow.json", "checkpoint.jsonl"})
+OUTPUT_SCAN_SKIP_ROOT_TMP_PREFIXES = ("workflow.yaml.", "workflow.json.")
+
+# Threads used to read and parse run workflow.yaml files concurrently
+LIST_WORKFLOWS_WORKERS = 16
+
+# Seconds a run directory without workflow.yaml is skipped by list_workflows before being re-checked
+MISSING_WORKFLOW_TTL = 5.0
+
+# Whole workflows run concurrently by submit_pipeline_workflow; further submissions wait in its queue
+PIPELINE_WORKERS = 4
+
+# Threads hashing a step's input files for its cache key; hashlib releases the GIL on large buffers
+HASH_WORKERS = min(4, os.cpu_count() or 1)
+
+# Docker SDK connections kept alive, enough for every concurrent step thread (docker-py defaults to 10)
+DOCKER_MAX_POOL_SIZE = 32
+
+# Linux FICLONE ioctl request: make a file share another file's extents (btrfs, xfs, bcachefs)
+FICLONE = 0x40049409
+
+
+def _reflink(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Clone the whole source file copy-on-write in one ioctl, sharing its blocks instead of copying them"""
+    if fcntl is None or offset:
+        raise OSError("reflink needs fcntl and clones whole files only")
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    return count
+
+
+# Kernel-side file copy mechanisms, fastest first: an explicit reflink, then copy_file_range
+# (which may still reflink on newer kernels), then sendfile
+KERNEL_COPY_STRATEGIES = (
+    ("Reflinked", _reflink),
+    ("Cloned", lambda src_fd, dst_fd, offset, count: os.copy_file_range(src_fd, dst_fd, count, offset, offset)),
+    ("Sendfile copied", lambda src_fd, dst_fd, offset, count: os.sendfile(dst_fd, src_fd, offset, count)),
+)
+
+
+def _load_docker():
+    """Import the Docker SDK on first use"""
+    global docker
+    if docker is None:
+        import docker as docker_sdk
+        docker = docker_sdk
+    return docker
+
+
+def write_json_file(path: Path, data: Any):
+    """Serialize data to an indented JSON file in a single write"""
+    Path(path).write_bytes(orjson.dumps(data, default=str, option=JSON_FILE_OPTIONS))
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> Optional[str]:
+    """Copy size bytes between fds with the first kernel-side mechanism that works here"""
+    for strategy, copy_chunk in KERNEL_COPY_STRATEGIES:
+        offset = 0
+        try:
+            while offset < size:
+                copied = copy_chunk(src_fd, dst_fd, offset, size - offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except (OSError, AttributeError):
+            # EXDEV/ENOSYS/EINVAL or not available on this platform
+            continue
+        if offset == size:
+            return strategy
+    return None
+
+
+def kernel_copy_file(source: Path, dest: Path) -> str:
+    """Copy a file without passing its data through Python, falling back to shutil.copy2"""
+    with open(source, 'rb') as src, open(dest, 'wb') as dst:
+        strategy = _kernel_copy(src.fileno(), dst.fileno(), os.fstat(src.fileno()).st_size)
+    if strategy:
+        shutil.copystat(source, dest)
+        return strategy
+    shutil.copy2(source, dest)
+    return "Copied"
+
+
+def iso_from_ns(ts_ns: int, timespec: str = 'auto') -> str:
+    """Format a time.time_ns() timestamp as a local ISO 8601 string"""
+    return datetime.fromtimestamp(ts_ns / 1e9).isoformat(timespec=timespec)
+
+
+@dataclass(frozen=True, slots=True)
+class FileRef:
+    """Step input file resolved once: host path, path under the /data mount and size (-1 if missing)"""
+    host_path: str
+    data_rel: str
+    size: int
+    
+    @property
+    def container_path(self) -> str:
+        return f"/data/{self.data_rel}"
 
 
 class ContainerProcessManager:
     """Enhanced container-based process management with better logging, tracking, and rerun capabilities"""
     
-    def __init__(self, logger, data_dir: str):
+    def __init__(self, logger, data_dir: str, docker_client=None):
         self.logger = logger
+        # Steps currently executing, across all workflows; sizes each step's {threads}
+        self._running_steps = 0
+        self._running_steps_lock = threading.Lock()
         self.data_dir = Path(data_dir)
+        # Cached string prefix for mapping host paths under data_dir into containers
+        self._data_dir_prefix = os.path.join(str(self.data_dir), "")
+        # docker run cidfiles; created once rather than on every step
+        (self.data_dir / ".cids").mkdir(parents=True, exist_ok=True)
         self.active_containers = {}
+        # Guards active_containers, which is shared by executor and monitor threads
+        self._containers_lock = threading.Lock()
+        # Long-lived containers reused across steps: (workflow_id, image, memory, cpus) -> container ID
+        self._pooled_containers = {}
+        # Callers running steps of a workflow: workflow_id -> count; the last one out removes its pool
+        self._pool_users: Dict[str, int] = {}
+        self._pool_lock = threading.Lock()
         self.process_queue = queue.Queue()
         self.monitor_thread = None
         self.running = False
+        # Persistent Docker SDK client, shared or created lazily; None falls back to the docker CLI
+        self._docker_client = docker_client
+        self._docker_client_failed = False
+        
+        # Tools whose image warm_images has already found locally
+        self._warmed_tools = set()
+    
+    def _get_docker_client(self):
+        """Get the shared Docker SDK client, or None if the daemon API is unreachable"""
+        if self._docker_client is None and not self._docker_client_failed:
+            try:
+                client = _load_docker().from_env(timeout=30, max_pool_size=DOCKER_MAX_POOL_SIZE)
+                client.ping()
+                self._docker_client = client
+                self.logger.info("✅ Connected to Docker daemon via SDK")
+            except Exception as e:
+                self._docker_client_failed = True
+                self.logger.warning(f"⚠️ Docker SDK unavailable, falling back to docker CLI: {e}")
+        return self._docker_client
+    
+    def _get_container_state(self, container_id: str) -> Optional[Dict[str, Any]]:
+        """Get a container's State (Status, ExitCode, ...), or None if it does not exist"""
+        client = self._get_docker_client()
+        if client is not None:
+            try:
+                return client.api.inspect_container(container_id).get('State', {})
+            except docker.errors.NotFound:
+                return None
+        
+        result = subprocess.run(
+            ["docker", "inspect", "--format", "{{json .State}}", container_id],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=10
+        )
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout)
         
     def start_monitoring(self):
         """Start the container monitoring thread"""
@@ -56,39 +317,34 @@ class ContainerProcessManager:
         """Monitor active containers for resource usage and health with robust error handling"""
         while self.running:
             try:
-                # Create a copy of the keys to avoid modification during iteration
-                container_ids = list(self.active_containers.keys())
+                # Snapshot under the lock to avoid modification during iteration
+                with self._containers_lock:
+                    tracked = list(self.active_containers.items())
                 
-                for container_id in container_ids:
-                    container_info = self.active_containers.get(container_id)
-                    if not container_info:
-                        continue
+                for container_id, container_info in tracked:
                         
                     try:
                         # Check if container is still running
-                        result = subprocess.run(
-                            ["docker", "inspect", "--format", "{{.State.Status}}", container_id],
-                            capture_output=True, text=True, timeout=10
-                        )
+                        state = self._get_container_state(container_id)
                         
-                        if result.returncode == 0:
-                            status = result.stdout.strip()
-                            if status not in ["running"]:
+                        if state is not None:
+                            status = state.get('Status')
+                            if status != "running":
                                 # Container finished or failed
                                 self._handle_container_completion(container_id, container_info, status)
                         else:
                             # Container not found, remove from tracking
                             self.logger.info(f"🧹 Removing non-existent container {container_id} from tracking")
-                            self.active_containers.pop(container_id, None)
+                            self._untrack_container(container_id)
                             
                     except subprocess.TimeoutExpired:
                         self.logger.warning(f"⚠️ Timeout inspecting container {container_id}, removing from tracking")
-                        self.active_containers.pop(container_id, None)
+                        self._untrack_container(container_id)
                     except Exception as e:
                         self.logger.warning(f"⚠️ Error monitoring container {container_id}: {e}")
                         # CRITICAL FIX: Always remove problematic containers to prevent infinite loops
                         self.logger.info(f"🧹 Removing problematic container {container_id} from tracking")
-                        self.active_containers.pop(container_id, None)
+                        self._untrack_container(container_id)
                         
                 # Intelligent periodic scan for missed completions
                 if hasattr(self, '_scan_counter'):
@@ -106,7 +362,8 @@ class ContainerProcessManager:
                 self.logger.error(f"❌ Critical error in container monitoring: {e}")
                 # Clear all containers if monitoring is completely broken
                 self.logger.warning("🚨 Clearing all tracked containers due to critical monitoring error")
-                self.active_containers.clear()
+                with self._containers_lock:
+                    self.active_containers.clear()
                 time.sleep(10)
     
     def _handle_container_completion(self, container_id: str, container_info: Dict[str, Any], status: str):
@@ -141,24 +398,38 @@ class ContainerProcessManager:
                 self.logger.warning(f"📊 Evidence check: {completion_evidence}")
             
             # Always remove from active containers
-            self.active_containers.pop(container_id, None)
+            self._untrack_container(container_id)
             
         except Exception as e:
             self.logger.error(f"❌ Error handling container completion {container_id}: {e}")
             # Always remove from tracking even on error
-            self.active_containers.pop(container_id, None)
+            self._untrack_container(container_id)
     
     def _get_container_logs(self, container_id: str) -> str:
         """Get logs from a container"""
         try:
-            result = subprocess.run(
-                ["docker", "logs", container_id],
-                capture_output=True, text=True, timeout=30
-            )
-            return result.stdout + result.stderr
+            logs = self._fetch_container_logs(container_id)
+            return logs if logs is not None else f"Error getting logs: container {container_id} not found"
         except Exception as e:
             return f"Error getting logs: {e}"
     
+    def _fetch_container_logs(self, container_id: str) -> Optional[str]:
+        """Fetch combined stdout/stderr logs of a container, or None if it does not exist"""
+        client = self._get_docker_client()
+        if client is not None:
+            try:
+                return client.api.logs(container_id).decode('utf-8', errors='replace')
+            except docker.errors.NotFound:
+                return None
+        
+        result = subprocess.run(
+            ["docker", "logs", container_id],
+            capture_output=True, text=True, timeout=30
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout + result.stderr
+    
     def _gather_completion_evidence(self, workflow_id: str, step_number: int, tool_name: str) -> Dict[str, Any]:
         """Gather evidence that a tool completed successfully"""
         evidence = {
@@ -175,9 +446,10 @@ class ContainerProcessManager:
             runs_dir = self.data_dir / "runs"
             output_dir = runs_dir / workflow_id / f"step_{step_number}_{tool_name}"
             if output_dir.exists():
-                output_files = list(output_dir.glob("*"))
-                evidence['has_output_files'] = len(output_files) > 0
-                evidence['output_file_count'] = len(output_files)
+                # Same entries glob("*") matched (hidden names excluded), from one listdir
+                output_count = sum(1 for name in os.listdir(output_dir) if not name.startswith('.'))
+                evidence['has_output_files'] = output_count > 0
+                evidence['output_file_count'] = output_count
             
             # Check for tool log file
             tool_log_file = output_dir / f"{tool_name}.log"
@@ -197,9 +469,8 @@ class ContainerProcessManager:
             if step_result_file.exists():
                 evidence['has_step_result'] = True
                 try:
-                    with open(step_result_file, 'r') as f:
-                        step_data = json.load(f)
-                        evidence['step_result_success'] = step_data.get('result', {}).get('success', False)
+                    step_data = orjson.loads(step_result_file.read_bytes())
+                    evidence['step_result_success'] = step_data.get('result', {}).get('success', False)
                 except:
                     pass
                     
@@ -219,7 +490,9 @@ class ContainerProcessManager:
             # Gather output files
             output_files = []
             if output_dir.exists():
-                output_files = [str(f) for f in output_dir.glob("*") if f.is_file()]
+                with os.scandir(output_dir) as entries:
+                    output_files = [entry.path for entry in entries
+                                    if not entry.name.startswith('.') and entry.is_file()]
             
             # Parse tool log for execution time and warnings
             execution_time = 0
@@ -237,6 +510,7 @@ class ContainerProcessManager:
                     pass
             
             # Create step result
+            recovered_at = datetime.now().isoformat()
             step_result = {
                 "step_number": step_number,
                 "tool_name": tool_name,
@@ -252,17 +526,16 @@ class ContainerProcessManager:
                     "stdout": "",
                     "stderr": "",
                     "exit_code": 0,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": recovered_at,
                     "warnings": warnings,
                     "recovery_method": "evidence_based"
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": recovered_at
             }
             
             # Save step result file
             step_result_file = step_results_dir / f"step_{step_number}_{tool_name}.json"
-            with open(step_result_file, 'w') as f:
-                json.dump(step_result, f, indent=2)
+            write_json_file(step_result_file, step_result)
             
             self.logger.info(f"📄 Created step result from evidence: {step_result_file}")
             
@@ -276,7 +549,6 @@ class ContainerProcessManager:
         """Log recovered step completion to workflow execution log"""
         try:
             # Create a temporary logger for this workflow
-            from logging_utils import DynamicWorkflowLogger
             recovery_logger = DynamicWorkflowLogger(workflow_id, f"Recovery-{tool_name}", str(self.data_dir))
             
             recovery_logger.logger.info("-" * 80)
@@ -298,32 +570,11 @@ class ContainerProcessManager:
         try:
             self.logger.info("🔍 Scanning for missed tool completions...")
             
-            # Check all workflow runs
-            runs_dir = self.data_dir / "runs"
-            for run_dir in runs_dir.glob("*"):
-                if not run_dir.is_dir():
-                    continue
-                    
-                workflow_id = run_dir.name
-                
-                # Check each step directory for completion evidence
-                for step_dir in run_dir.glob("step_*"):
-                    try:
-                        # Extract step info from directory name
-                        step_parts = step_dir.name.split('_')
-                        if len(step_parts) >= 3:
-                            step_number = int(step_parts[1])
-                            tool_name = step_parts[2]
-                            
-                            # Check if we have completion evidence but no step result
-                            evidence = self._gather_completion_evidence(workflow_id, step_number, tool_name)
-                            
-                            if (evidence['has_output_files'] or evidence['tool_log_indicates_completion']) and not evidence['has_step_result']:
-                                self.logger.info(f"🔄 Found missed completion: {workflow_id} - {tool_name}")
-                                self._create_step_result_from_evidence(workflow_id, step_number, tool_name, evidence)
-                                
-                    except Exception as e:
-                        self.logger.warning(f"⚠️ Error checking step {step_dir}: {e}")
+            # Check all workflow runs, overlapping their step log and result file reads
+            with os.scandir(self.data_dir / "runs") as entries:
+                workflow_ids = [entry.name for entry in entries if entry.is_dir()]
+            with ThreadPoolExecutor(max_workers=LIST_WORKFLOWS_WORKERS) as executor:
+                list(executor.map(self._scan_run_steps_for_missed_completions, workflow_ids))
                         
         except Exception as e:
             self.logger.error(f"❌ Error in missed completion scan: {e}")
@@ -339,38 +590,56 @@ class ContainerProcessManager:
             if not run_dir.exists():
                 return
                 
-            # Check each step directory for completion evidence
-            for step_dir in run_dir.glob("step_*"):
-                try:
-                    # Extract step info from directory name
-                    step_parts = step_dir.name.split('_')
-                    if len(step_parts) >= 3:
-                        step_number = int(step_parts[1])
-                        tool_name = step_parts[2]
-                        
-                        # Check if we have completion evidence but no step result
-                        evidence = self._gather_completion_evidence(workflow_id, step_number, tool_name)
-                        
-                        if (evidence['has_output_files'] or evidence['tool_log_indicates_completion']) and not evidence['has_step_result']:
-                            self.logger.info(f"🔄 Recovering missed completion: {workflow_id} - {tool_name}")
-                            self._create_step_result_from_evidence(workflow_id, step_number, tool_name, evidence)
-                            
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Error checking step {step_dir}: {e}")
+            self._scan_run_steps_for_missed_completions(workflow_id)
                     
         except Exception as e:
             self.logger.error(f"❌ Error in workflow completion scan: {e}")
     
+    def _scan_run_steps_for_missed_completions(self, workflow_id: str):
+        """Recover step results for a run's step directories that show completion evidence"""
+        run_dir = self.data_dir / "runs" / workflow_id
+        try:
+            with os.scandir(run_dir) as entries:
+                step_dirs = [entry.name for entry in entries if entry.name.startswith("step_")]
+        except FileNotFoundError:
+            return
+        
+        # Check each step directory for completion evidence
+        for step_dir in step_dirs:
+            try:
+                # Extract step info from directory name
+                step_parts = step_dir.split('_')
+                if len(step_parts) >= 3:
+                    step_number = int(step_parts[1])
+                    tool_name = step_parts[2]
+                    
+                    # Check if we have completion evidence but no step result
+                    evidence = self._gather_completion_evidence(workflow_id, step_number, tool_name)
+                    
+                    if (evidence['has_output_files'] or evidence['tool_log_indicates_completion']) and not evidence['has_step_result']:
+                        self.logger.info(f"🔄 Recovering missed completion: {workflow_id} - {tool_name}")
+                        self._create_step_result_from_evidence(workflow_id, step_number, tool_name, evidence)
+                        
+            except Exception as e:
+                self.logger.warning(f"⚠️ Error checking step {step_dir}: {e}")
+    
     def execute_tool_in_container(self, tool_name: str, input_files: List[str], 
                                  output_dir: str, workflow_id: str, step_number: int,
                                  tool_config: Dict[str, Any] = None) -> 'ContainerExecutionResult':
         """Execute a tool in a dedicated container with enhanced tracking and validation"""
         container_id = None
-        start_time = time.time()
+        container_name = None
+        pooled_container_id = None
+        start_time = time.perf_counter()
+        with self._running_steps_lock:
+            self._running_steps += 1
         
         try:
+            # Resolve inputs once; the refs are shared by validation and command building
+            input_refs = [self._make_file_ref(f) for f in input_files]
+            
             # Pre-execution validation
-            validation_result = self._validate_container_execution(tool_name, input_files, output_dir)
+            validation_result = self._validate_container_execution(tool_name, input_refs, output_dir)
             if not validation_result['valid']:
                 return ContainerExecutionResult(
                     success=False,
@@ -387,13 +656,18 @@ class ContainerProcessManager:
             # Add container name for tracking
             container_name = f"bioframe-{workflow_id}-step{step_number}-{tool_name}-{int(time.time())}"
             
+            # Short, frequently repeated tools run via docker exec in a pooled container
+            tool_config = tool_config or {}
+            if tool_name.lower() in POOLED_TOOLS:
+                pooled_container_id = self._get_pooled_container(workflow_id, tool_name, tool_config)
+            
             # Build container command with name
             docker_cmd = self._build_enhanced_docker_command(
-                tool_name, input_files, output_dir, tool_config or {}, container_name
+                tool_name, input_refs, output_dir, tool_config, container_name, pooled_container_id
             )
             
             self.logger.info(f"🚀 Starting container execution: {tool_name}")
-            self.logger.info(f"📋 Command: {' '.join(docker_cmd)}")
+            self.logger.info(f"📋 Command: {shlex.join(docker_cmd)}")
             
             # Validate Docker command before execution
             if not self._validate_docker_command(docker_cmd):
@@ -410,31 +684,38 @@ class ContainerProcessManager:
                 )
             
             # Start container and wait for completion using robust monitoring
+            # Binary pipes: output is read in blocks and decoded once per batch of lines
             process = subprocess.Popen(
                 docker_cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                bufsize=PIPE_READ_SIZE
             )
             
-            # Track container
-            container_id = self._get_container_id_by_name(container_name)
-            if container_id:
-                self.active_containers[container_id] = {
-                    'workflow_id': workflow_id,
-                    'step_number': step_number,
-                    'tool_name': tool_name,
-                    'process': process,
-                    'started_at': datetime.now().isoformat(),
-                    'status': 'running'
-                }
+            # Track container (pooled ones are tracked while steps exec in them, so stopping it cancels them)
+            if pooled_container_id:
+                container_id = pooled_container_id
+                self._track_pooled_step(container_id, workflow_id, step_number, tool_name, process)
+            else:
+                container_id = self._read_container_id(container_name, process)
+            if container_id and not pooled_container_id:
+                with self._containers_lock:
+                    self.active_containers[container_id] = {
+                        'workflow_id': workflow_id,
+                        'step_number': step_number,
+                        'tool_name': tool_name,
+                        'process': process,
+                        'started_at': datetime.now().isoformat(),
+                        'status': 'running'
+                    }
             
             # Use robust container monitoring instead of blocking I/O
             stdout_lines, stderr_lines = self._monitor_container_with_fallback(
-                container_name, container_id, tool_name, process
+                container_name, None if pooled_container_id else container_id, tool_name, process,
+                log_prefix=self.data_dir / "runs" / workflow_id / "logs" / f"step_{step_number}_{tool_name}"
             )
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # CORE FIX: Better success detection for long-running tools
             # Don't rely solely on process.returncode for container-based execution
@@ -461,12 +742,13 @@ class ContainerProcessManager:
             )
             
             # CRITICAL: Validate tool output and detect file reading failures
-            if not self._validate_tool_output(tool_name, result, input_files, output_dir):
+            if not self._validate_tool_output(tool_name, result, input_refs, output_dir):
                 self.logger.error(f"❌ Tool '{tool_name}' output validation FAILED - workflow should stop")
                 # Override success to False if validation fails
-                result.success = False
-                result.error_message = f"Tool output validation failed: {result.stderr}"
-                return result
+                return replace(
+                    result, success=False,
+                    error_message=f"Tool output validation failed: {result.stderr}"
+                )
             
             if success:
                 self.logger.info(f"✅ Tool {tool_name} completed successfully in {execution_time:.2f}s")
@@ -476,76 +758,215 @@ class ContainerProcessManager:
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.logger.error(f"❌ Container execution error for {tool_name}: {e}")
             
             return ContainerExecutionResult(
                 success=False,
                 output_files=[],
-                error_message=f"Container execution error: {str(e)}",
+                error_message=f"Container execution error: {e}",
                 execution_time=execution_time,
                 container_id=container_id,
-                container_name=container_name if 'container_name' in locals() else None,
+                container_name=container_name,
                 stdout="",
                 stderr=str(e),
                 exit_code=-1
             )
+        finally:
+            if pooled_container_id:
+                self._untrack_pooled_step(pooled_container_id)
+            with self._running_steps_lock:
+                self._running_steps -= 1
     
-    def _build_enhanced_docker_command(self, tool_name: str, input_files: List[str], 
+    def _tool_threads(self) -> int:
+        """This step's share of the host CPUs among the steps running now, never below the default"""
+        with self._running_steps_lock:
+            running = max(1, self._running_steps)
+        return max(DEFAULT_TOOL_THREADS, (os.cpu_count() or 1) // running)
+    
+    def _build_enhanced_docker_command(self, tool_name: str, input_refs: List[FileRef], 
                                      output_dir: str, tool_config: Dict[str, Any], 
-                                     container_name: str = None) -> List[str]:
+                                     container_name: str = None,
+                                     pooled_container_id: str = None) -> List[str]:
         """Build Docker command using static volume mounts from docker-compose.yml"""
+        if pooled_container_id:
+            # Run the step inside the workflow's long-lived container for this image
+            cmd = ["docker", "exec"]
+            cmd.extend(self._build_step_environment(tool_name, output_dir, tool_config))
+            cmd.extend(["-w", "/data", pooled_container_id])
+            cmd.extend(self._get_dynamic_tool_command_args(tool_name, input_refs, output_dir, tool_config))
+            return cmd
+        
         # CORE FIX: Don't auto-remove containers until we capture exit codes
         cmd = ["docker", "run"]
+        cmd.extend(self._build_container_run_options(tool_config))
+        cmd.extend(self._build_step_environment(tool_name, output_dir, tool_config))
+        
+        # Add container name for tracking and have docker write the container ID to a cidfile
+        if container_name:
+            cmd.extend(["--name", container_name])
+            cidfile = self._get_cidfile_path(container_name)
+            cidfile.unlink(missing_ok=True)  # docker run refuses to overwrite an existing cidfile
+            cmd.extend(["--cidfile", str(cidfile)])
+        
+        # Use appropriate container image
+        image_name = self._get_container_image(tool_name)
+        cmd.append(image_name)
+        
+        # Add tool-specific command arguments using dynamic metadata extraction
+        cmd.extend(self._get_dynamic_tool_command_args(tool_name, input_refs, output_dir, tool_config))
         
-        # Add resource limits (can be overridden by tool metadata)
-        # Set defaults to empty so tools can use unlimited resources
+        return cmd
+    
+    def _resource_limits(self, tool_config: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """Get the (memory, cpus) limits for a tool container, None where unlimited"""
+        # Defaults are empty so tools can use unlimited resources (can be overridden by tool metadata)
         memory_limit = tool_config.get('memory_requirement', '')
         cpu_limit = tool_config.get('cpu_requirement', '')
         
-        # Only add limits if they are specified and not empty/unlimited
-        if memory_limit and memory_limit.strip() and memory_limit.lower() not in ['unlimited', '']:
-            cmd.extend(["--memory", memory_limit])
+        # Only apply limits if they are specified and not empty/unlimited
+        if not (memory_limit and memory_limit.strip() and memory_limit.lower() not in ['unlimited', '']):
+            memory_limit = None
         if cpu_limit and str(cpu_limit).strip() and str(cpu_limit).lower() not in ['unlimited', '']:
-            cmd.extend(["--cpus", str(cpu_limit)])
-        cmd.extend(["--ulimit", "nofile=65536:65536"])  # File descriptor limit
+            cpu_limit = str(cpu_limit)
+        else:
+            cpu_limit = None
+        return memory_limit, cpu_limit
+    
+    def _build_container_run_options(self, tool_config: Dict[str, Any]) -> List[str]:
+        """Build docker run options for resource limits, mounts and working directory"""
+        options = []
         
-        # Add environment variables
-        cmd.extend(["-e", "PYTHONUNBUFFERED=1"])
-        cmd.extend(["-e", f"BIOFRAME_TOOL_NAME={tool_name}"])
-        cmd.extend(["-e", f"BIOFRAME_STEP_NUMBER={tool_config.get('step_number', 1)}"])
+        memory_limit, cpu_limit = self._resource_limits(tool_config)
+        if memory_limit:
+            options.extend(["--memory", memory_limit])
+        if cpu_limit:
+            options.extend(["--cpus", cpu_limit])
+        options.extend(["--ulimit", "nofile=65536:65536"])  # File descriptor limit
         
         # Use the same host data directory that the orchestrator can access
         # This ensures both orchestrator and tool containers share the same data directory
-        host_data_path = "G:/Work File/Projects/BioFrame/data"
-        cmd.extend(["-v", f"{host_data_path}:/data"])
+        host_data_path = _host_data_path()
+        options.extend(["-v", f"{host_data_path}:/data"])
         self.logger.info(f"✅ Using shared data mount: {host_data_path}:/data")
         
         # Also mount the host data directory as host-data for Windows compatibility
-        cmd.extend(["-v", f"{host_data_path}:/host-data:ro"])
+        options.extend(["-v", f"{host_data_path}:/host-data:ro"])
         self.logger.info(f"✅ Using host data mount: {host_data_path}:/host-data:ro")
         
         # Set working directory to data directory
-        cmd.extend(["-w", "/data"])
+        options.extend(["-w", "/data"])
         
+        return options
+    
+    def _container_run_kwargs(self, tool_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Docker SDK equivalent of _build_container_run_options"""
+        memory_limit, cpu_limit = self._resource_limits(tool_config)
+        host_data_path = _host_data_path()
+        kwargs = {
+            'volumes': [f"{host_data_path}:/data", f"{host_data_path}:/host-data:ro"],
+            'working_dir': "/data",
+            'ulimits': [_load_docker().types.Ulimit(name="nofile", soft=65536, hard=65536)],
+        }
+        if memory_limit:
+            kwargs['mem_limit'] = memory_limit
+        if cpu_limit:
+            kwargs['nano_cpus'] = int(float(cpu_limit) * 1e9)
+        return kwargs
+    
+    def _build_step_environment(self, tool_name: str, output_dir: str, tool_config: Dict[str, Any]) -> List[str]:
+        """Build the per-step environment variable options"""
         # Ensure output directory exists in the container
         output_relative = str(Path(output_dir).relative_to(self.data_dir))
-        cmd.extend(["-e", f"OUTPUT_DIR=/data/{output_relative}"])
-        
-        # Add container name for tracking
-        if container_name:
-            cmd.extend(["--name", container_name])
-        
-        # Use appropriate container image
+        return [
+            "-e", "PYTHONUNBUFFERED=1",
+            "-e", f"BIOFRAME_TOOL_NAME={tool_name}",
+            "-e", f"BIOFRAME_STEP_NUMBER={tool_config.get('step_number', 1)}",
+            "-e", f"OUTPUT_DIR=/data/{output_relative}",
+        ]
+    
+    def _get_pooled_container(self, workflow_id: str, tool_name: str, 
+                              tool_config: Dict[str, Any]) -> Optional[str]:
+        """Get the workflow's long-lived container for a tool image, starting it on first use"""
         image_name = self._get_container_image(tool_name)
-        cmd.append(image_name)
+        # The container's limits apply to every step exec'd in it, so steps only share matching limits
+        memory_limit, cpu_limit = self._resource_limits(tool_config)
+        pool_key = (workflow_id, image_name, memory_limit, cpu_limit)
         
-        # Add tool-specific command arguments using dynamic metadata extraction
-        cmd.extend(self._get_dynamic_tool_command_args(tool_name, input_files, output_dir, tool_config))
+        with self._pool_lock:
+            container_id = self._pooled_containers.get(pool_key)
+            if container_id:
+                state = self._get_container_state(container_id)
+                if state is not None and state.get('Status') == 'running':
+                    return container_id
+                self.logger.warning(f"⚠️ Pooled container {container_id} for {image_name} is gone, starting a new one")
+            
+            pool_name = f"bioframe-pool-{workflow_id}-{tool_name.lower()}"
+            if memory_limit or cpu_limit:
+                pool_name += f"-m{memory_limit or 'unlimited'}-c{cpu_limit or 'unlimited'}".lower()
+            try:
+                client = self._get_docker_client()
+                if client is not None:
+                    # Reuses the SDK's persistent daemon connection instead of spawning the docker CLI
+                    container_id = client.containers.run(
+                        image_name, ["infinity"], entrypoint="sleep", name=pool_name,
+                        detach=True, remove=True, **self._container_run_kwargs(tool_config)
+                    ).id
+                else:
+                    cmd = ["docker", "run", "-d", "--rm", "--name", pool_name]
+                    cmd.extend(self._build_container_run_options(tool_config))
+                    cmd.extend(["--entrypoint", "sleep", image_name, "infinity"])
+                    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=120)
+                    if result.returncode != 0:
+                        self.logger.warning(f"⚠️ Could not start pooled container for {tool_name}: {result.stderr.strip()}")
+                        return None
+                    container_id = result.stdout.strip()
+            except Exception as e:
+                self.logger.warning(f"⚠️ Could not start pooled container for {tool_name}: {e}")
+                return None
+            
+            self._pooled_containers[pool_key] = container_id
+            self.logger.info(f"♻️ Started pooled container {pool_name} ({container_id}) for {tool_name}")
+            return container_id
+    
+    def acquire_pool(self, workflow_id: str):
+        """Register a caller about to run steps of a workflow, keeping its pooled containers alive"""
+        with self._pool_lock:
+            self._pool_users[workflow_id] = self._pool_users.get(workflow_id, 0) + 1
+    
+    def release_pool(self, workflow_id: str) -> int:
+        """Unregister a caller; once no caller is running steps of the workflow, remove its pool"""
+        with self._pool_lock:
+            users = self._pool_users.get(workflow_id, 0) - 1
+            if users > 0:
+                self._pool_users[workflow_id] = users
+                return 0
+            self._pool_users.pop(workflow_id, None)
+        return self.cleanup_pool(workflow_id)
+    
+    def cleanup_pool(self, workflow_id: str) -> int:
+        """Remove the long-lived containers started for a workflow"""
+        with self._pool_lock:
+            pool_keys = [key for key in self._pooled_containers if key[0] == workflow_id]
+            container_ids = [self._pooled_containers.pop(key) for key in pool_keys]
         
-        return cmd
+        client = self._get_docker_client() if container_ids else None
+        for container_id in container_ids:
+            try:
+                if client is not None:
+                    client.api.remove_container(container_id, force=True)
+                else:
+                    subprocess.run(
+                        ["docker", "rm", "-f", container_id],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, timeout=30
+                    )
+                self.logger.info(f"🧹 Removed pooled container {container_id}")
+            except Exception as e:
+                self.logger.warning(f"⚠️ Error removing pooled container {container_id}: {e}")
+        
+        return len(container_ids)
     
-    def _get_dynamic_tool_command_args(self, tool_name: str, input_files: List[str], 
+    def _get_dynamic_tool_command_args(self, tool_name: str, input_refs: List[FileRef], 
                                       output_dir: str, tool_config: Dict[str, Any]) -> List[str]:
         """Get tool command arguments dynamically from container metadata"""
         try:
@@ -568,7 +989,7 @@ class ContainerProcessManager:
                 return [metadata.get('tool_primary_command', tool_name), "--help"]
             
             # Build command based on metadata template
-            return self._build_command_from_template(tool_name, metadata, input_files, output_dir, tool_config)
+            return self._build_command_from_template(tool_name, metadata, input_refs, output_dir, tool_config)
             
         except Exception as e:
             self.logger.error(f"Failed to get dynamic command for {tool_name}: {e}")
@@ -659,7 +1080,7 @@ class ContainerProcessManager:
         }
     
     def _build_command_from_template(self, tool_name: str, metadata: Dict[str, str], 
-                                   input_files: List[str], output_dir: str, 
+                                   input_refs: List[FileRef], output_dir: str, 
                                    tool_config: Dict[str, Any]) -> List[str]:
         """Build command dynamically from metadata template"""
         try:
@@ -672,7 +1093,7 @@ class ContainerProcessManager:
                 return [primary_command, "--help"]
             
             # Build command using template substitution
-            command = self._substitute_template_variables(template, input_files, output_dir, metadata)
+            command = self._substitute_template_variables(template, input_refs, output_dir, metadata)
             
             # Debug: Log the generated command
             self.logger.info(f"🔧 Generated command for {tool_name}: {command}")
@@ -690,66 +1111,65 @@ class ContainerProcessManager:
             self.logger.error(f"Error building command for {tool_name}: {e}")
             return [tool_name, "--help"]
     
-    def _substitute_template_variables(self, template: str, input_files: List[str], 
+    def _substitute_template_variables(self, template: str, input_refs: List[FileRef], 
                                      output_dir: str, metadata: Dict[str, str]) -> str:
         """Substitute all template variables with actual values"""
-        command = template
-        
         # Basic substitutions - use actual output directory path instead of environment variable
         output_path = Path(output_dir)
         output_relative = str(output_path.relative_to(self.data_dir))
         container_output_dir = f"/data/{output_relative}"
         
+        # Container paths were resolved with the refs; reuse them for all aliases
+        container_paths = [ref.container_path for ref in input_refs]
+        
         substitutions = {
             '{output_dir}': container_output_dir,
             '{OUTPUT_DIR}': container_output_dir,
-            '{input_files}': self._format_input_files_for_template(input_files),
+            '{input_files}': ' '.join(container_paths),
             '{options}': '',  # Default empty options
-            '{threads}': '4',
+            '{threads}': str(self._tool_threads()),
             '{memory}': '8'
         }
         
         # Add input file specific substitutions
-        for i, input_file in enumerate(input_files):
-            substitutions[f'{{input_file_{i+1}}}'] = self._get_container_path(input_file)
+        for i, container_path in enumerate(container_paths):
+            substitutions[f'{{input_file_{i+1}}}'] = container_path
             
         # Add common aliases
-        if len(input_files) >= 1:
-            substitutions['{input_file}'] = self._get_container_path(input_files[0])
-            substitutions['{read1}'] = self._get_container_path(input_files[0])
-            substitutions['{assembly_files}'] = self._get_container_path(input_files[0])
-            substitutions['{reference}'] = self._get_container_path(input_files[0])
-            
-        if len(input_files) >= 2:
-            substitutions['{read2}'] = self._get_container_path(input_files[1])
-            substitutions['{reads}'] = ' '.join([self._get_container_path(f) for f in input_files[1:]])
-        
-        # Apply all substitutions
-        for placeholder, value in substitutions.items():
-            command = command.replace(placeholder, str(value))
-        
-        return command
-    
-    def _get_container_path(self, file_path: str) -> str:
-        """Convert host file path to container path"""
-        file_path_obj = Path(file_path)
-        if str(file_path_obj).startswith(str(self.data_dir)):
-            relative_path = file_path_obj.relative_to(self.data_dir)
-            return f"/data/{relative_path}"
-        else:
-            return f"/data/{file_path_obj.name}"
+        if len(container_paths) >= 1:
+            substitutions['{input_file}'] = container_paths[0]
+            substitutions['{read1}'] = container_paths[0]
+            substitutions['{assembly_files}'] = container_paths[0]
+            substitutions['{reference}'] = container_paths[0]
+            
+        if len(container_paths) >= 2:
+            substitutions['{read2}'] = container_paths[1]
+            substitutions['{reads}'] = ' '.join(container_paths[1:])
+        
+        # Apply all substitutions in a single pass; unknown placeholders are left as-is
+        return TEMPLATE_PLACEHOLDER_PATTERN.sub(
+            lambda match: str(substitutions.get(match.group(0), match.group(0))), template
+        )
     
-    def _format_input_files_for_template(self, input_files: List[str]) -> str:
-        """Format input files for template substitution"""
-        container_paths = [self._get_container_path(f) for f in input_files]
-        return ' '.join(container_paths)
+    def _make_file_ref(self, file_path: str) -> FileRef:
+        """Resolve a host file path to its path under the container /data mount and its size"""
+        file_path = os.fspath(file_path)
+        if file_path.startswith(self._data_dir_prefix):
+            data_rel = file_path[len(self._data_dir_prefix):]
+        else:
+            data_rel = os.path.basename(file_path)
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            size = -1
+        return FileRef(file_path, data_rel, size)
     
     def _needs_shell_wrapper(self, command: str) -> bool:
         """Check if command needs shell wrapper (contains pipes, redirects, etc.)"""
         shell_operators = ['>', '<', '|', '&&', '||', ';', '$(', '`']
         return any(op in command for op in shell_operators)
     
-    def _validate_container_execution(self, tool_name: str, input_files: List[str], output_dir: str) -> Dict[str, Any]:
+    def _validate_container_execution(self, tool_name: str, input_refs: List[FileRef], output_dir: str) -> Dict[str, Any]:
         """Validate container execution parameters before running"""
         try:
             # Check if tool is supported
@@ -760,38 +1180,43 @@ class ContainerProcessManager:
                 }
             
             # Check if input files exist and are readable
-            for input_file in input_files:
-                input_path = Path(input_file)
-                if not input_path.exists():
+            for input_ref in input_refs:
+                if input_ref.size < 0:
                     return {
                         'valid': False,
-                        'error': f"Input file does not exist: {input_file}"
+                        'error': f"Input file does not exist: {input_ref.host_path}"
                     }
-                if not os.access(input_file, os.R_OK):
+                if not os.access(input_ref.host_path, os.R_OK):
                     return {
                         'valid': False,
-                        'error': f"Input file is not readable: {input_file}"
+                        'error': f"Input file is not readable: {input_ref.host_path}"
                     }
             
             # Check if output directory can be created and is writable
             output_path = Path(output_dir)
             try:
-                output_path.mkdir(parents=True, exist_ok=True)
+                # Callers normally created it already, so one access() check is the common path
                 if not os.access(output_dir, os.W_OK):
-                    return {
-                        'valid': False,
-                        'error': f"Output directory is not writable: {output_dir}"
-                    }
+                    output_path.mkdir(parents=True, exist_ok=True)
+                    if not os.access(output_dir, os.W_OK):
+                        return {
+                            'valid': False,
+                            'error': f"Output directory is not writable: {output_dir}"
+                        }
             except Exception as e:
                 return {
                     'valid': False,
                     'error': f"Cannot create or access output directory {output_dir}: {e}"
                 }
             
-            # Check if Docker is available
+            # Check if Docker is available (a live SDK client has already pinged the daemon)
+            client = self._get_docker_client()
             try:
-                result = subprocess.run(["docker", "--version"], capture_output=True, text=True)
-                if result.returncode != 0:
+                returncode = 0 if client is not None else subprocess.run(
+                    ["docker", "--version"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+                ).returncode
+                if returncode != 0:
                     return {
                         'valid': False,
                         'error': "Docker is not available or not running"
@@ -805,11 +1230,18 @@ class ContainerProcessManager:
             # Check if container image exists
             image_name = self._get_container_image(tool_name)
             try:
-                result = subprocess.run(
-                    ["docker", "inspect", image_name], 
-                    capture_output=True, text=True
-                )
-                if result.returncode != 0:
+                if client is not None:
+                    try:
+                        client.api.inspect_image(image_name)
+                        image_exists = True
+                    except docker.errors.ImageNotFound:
+                        image_exists = False
+                else:
+                    image_exists = subprocess.run(
+                        ["docker", "inspect", image_name],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+                    ).returncode == 0
+                if not image_exists:
                     return {
                         'valid': False,
                         'error': f"Container image '{image_name}' does not exist. Please build the container first."
@@ -829,7 +1261,7 @@ class ContainerProcessManager:
             }
     
     def _validate_tool_output(self, tool_name: str, result: 'ContainerExecutionResult', 
-                            input_files: List[str], output_dir: str) -> bool:
+                            input_refs: List[FileRef], output_dir: str) -> bool:
         """Simple validation - trust the exit code"""
         # Tool finished and we have reliable exit code - that's all we need!
         return result.exit_code == 0
@@ -837,14 +1269,14 @@ class ContainerProcessManager:
     def _validate_docker_command(self, docker_cmd: List[str]) -> bool:
         """Validate Docker command before execution"""
         try:
-            # Check if command starts with 'docker run'
-            if not (len(docker_cmd) >= 2 and docker_cmd[0] == "docker" and docker_cmd[1] == "run"):
-                self.logger.error("❌ Invalid Docker command: must start with 'docker run'")
+            # Check if command starts with 'docker run' (or 'docker exec' into a pooled container)
+            if not (len(docker_cmd) >= 2 and docker_cmd[0] == "docker" and docker_cmd[1] in ("run", "exec")):
+                self.logger.error("❌ Invalid Docker command: must start with 'docker run' or 'docker exec'")
                 return False
             
-            # Check for required volume mounts
+            # Check for required volume mounts (pooled containers were started with them)
             has_volume_mounts = any(arg.startswith("-v") or arg.startswith("--volume") for arg in docker_cmd)
-            if not has_volume_mounts:
+            if docker_cmd[1] == "run" and not has_volume_mounts:
                 self.logger.warning("⚠️ No volume mounts found in Docker command")
             
             # Check for container image
@@ -870,11 +1302,11 @@ class ContainerProcessManager:
             # Get all bioframe tool images
             result = subprocess.run([
                 "docker", "images", "--format", "{{.Repository}}:{{.Tag}}", "--filter", "reference=bioframe-*"
-            ], capture_output=True, text=True, timeout=30)
+            ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=30)
             
             if result.returncode != 0:
                 self.logger.warning("Could not list Docker images, falling back to default tools")
-                return ["fastqc", "trimmomatic", "spades", "quast", "multiqc"]
+                return list(DEFAULT_TOOLS)
             
             # Extract tool names from image names
             tools = []
@@ -888,14 +1320,44 @@ class ContainerProcessManager:
             
             if not tools:
                 self.logger.warning("No bioframe tools found, falling back to default tools")
-                return ["fastqc", "trimmomatic", "spades", "quast", "multiqc"]
+                return list(DEFAULT_TOOLS)
             
             self.logger.info(f"🔍 Discovered {len(tools)} tools: {', '.join(tools)}")
             return tools
             
         except Exception as e:
             self.logger.error(f"Error discovering tools: {e}")
-            return ["fastqc", "trimmomatic", "spades", "quast", "multiqc"]
+            return list(DEFAULT_TOOLS)
+    
+    def get_image_id(self, tool_name: str) -> Optional[str]:
+        """Get the content-addressed ID of a tool's container image"""
+        image_name = self._get_container_image(tool_name)
+        try:
+            client = self._get_docker_client()
+            if client is not None:
+                return client.api.inspect_image(image_name).get('Id')
+            result = subprocess.run(
+                ["docker", "image", "inspect", "--format", "{{.Id}}", image_name],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=30
+            )
+            return result.stdout.strip() if result.returncode == 0 else None
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not inspect image {image_name}: {e}")
+            return None
+    
+    def warm_images(self, tool_names: List[str]) -> List[str]:
+        """Inspect tool images concurrently so missing ones are reported before a step needs them"""
+        # Only images found present are remembered, so a missing one is re-checked after it is pulled
+        tool_names = [tool_name for tool_name in dict.fromkeys(tool_names) if tool_name not in self._warmed_tools]
+        if not tool_names:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(tool_names), LIST_WORKFLOWS_WORKERS)) as executor:
+            image_ids = list(executor.map(self.get_image_id, tool_names))
+        missing = [tool_name for tool_name, image_id in zip(tool_names, image_ids) if not image_id]
+        self._warmed_tools.update(tool_name for tool_name, image_id in zip(tool_names, image_ids) if image_id)
+        for tool_name in missing:
+            self.logger.warning(f"⚠️ Image {self._get_container_image(tool_name)} for {tool_name} is not available locally")
+        return missing
     
     def _get_container_image(self, tool_name: str) -> str:
         """Dynamically get the appropriate container image for a tool"""
@@ -903,33 +1365,38 @@ class ContainerProcessManager:
         return f"bioframe-{tool_name.lower()}:latest"
     
     
-    def _get_container_id_by_name(self, container_name: str) -> Optional[str]:
-        """Get container ID by name with retry logic and better error handling"""
+    def _get_cidfile_path(self, container_name: str) -> Path:
+        """Get the cidfile path docker run writes the container ID to"""
+        return self.data_dir / ".cids" / f"{container_name}.cid"
+    
+    def _read_container_id(self, container_name: str, process: subprocess.Popen = None,
+                           timeout: float = 5.0) -> Optional[str]:
+        """Read the container ID written by docker run --cidfile"""
         if not container_name:
             self.logger.error("❌ Cannot get container ID: container_name is None or empty")
             return None
-            
-        max_attempts = 10
-        for attempt in range(max_attempts):
+        
+        cidfile = self._get_cidfile_path(container_name)
+        deadline = time.monotonic() + timeout
+        while True:
             try:
-                result = subprocess.run(
-                    ["docker", "ps", "-q", "-f", f"name={container_name}"],
-                    capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    container_id = result.stdout.strip()
+                container_id = cidfile.read_text().strip()
+                if container_id:
+                    cidfile.unlink(missing_ok=True)
                     self.logger.info(f"✅ Found container ID: {container_id} for {container_name}")
                     return container_id
-                    
-                # Container not found yet, wait and retry
-                time.sleep(0.5)
-                
-            except subprocess.TimeoutExpired:
-                self.logger.warning(f"⚠️ Timeout getting container ID for {container_name} (attempt {attempt + 1})")
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                self.logger.warning(f"⚠️ Error getting container ID for {container_name}: {e}")
-                
-        self.logger.warning(f"⚠️ Could not find container ID for {container_name} after {max_attempts} attempts")
+                self.logger.warning(f"⚠️ Error reading cidfile for {container_name}: {e}")
+                return None
+            
+            # docker run writes the cidfile as soon as the container is created
+            if time.monotonic() >= deadline or (process is not None and process.poll() is not None):
+                break
+            time.sleep(0.05)
+        
+        self.logger.warning(f"⚠️ Could not read container ID for {container_name} from {cidfile}")
         return None
     
     def force_completion_scan(self):
@@ -937,36 +1404,83 @@ class ContainerProcessManager:
         self.logger.info("🔍 Manually triggered completion scan")
         self._scan_for_missed_completions()
     
-    def get_active_containers(self) -> Dict[str, Any]:
-        """Get currently tracked active containers"""
-        return self.active_containers.copy()
-    
     def _collect_output_files(self, output_dir: str, tool_name: str) -> List[str]:
         """Collect output files from output directory"""
-        output_path = Path(output_dir)
         output_files = []
         
-        if output_path.exists():
-            for file_path in output_path.rglob("*"):
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    output_files.append(str(file_path))
+        # One scandir per directory (like rglob, symlinked directories are not descended into);
+        # subdirectories are pushed in reverse so they are visited in listing order
+        stack = [output_dir]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    subdirs = []
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif not entry.name.startswith('.') and entry.is_file():
+                            output_files.append(entry.path)
+            except FileNotFoundError:
+                continue
+            stack.extend(reversed(subdirs))
         
         return output_files
     
     
     def get_active_containers(self) -> Dict[str, Dict[str, Any]]:
         """Get information about active containers"""
-        return self.active_containers.copy()
+        with self._containers_lock:
+            return dict(self.active_containers)
+    
+    def _untrack_container(self, container_id: str):
+        """Stop tracking a container"""
+        with self._containers_lock:
+            self.active_containers.pop(container_id, None)
+    
+    def _track_pooled_step(self, container_id: str, workflow_id: str, step_number: int,
+                           tool_name: str, process: subprocess.Popen):
+        """Track a pooled container while steps exec in it; concurrent steps share one entry"""
+        with self._containers_lock:
+            container_info = self.active_containers.get(container_id)
+            if container_info is None:
+                container_info = self.active_containers[container_id] = {
+                    'workflow_id': workflow_id,
+                    'step_number': step_number,
+                    'tool_name': tool_name,
+                    'process': process,
+                    'started_at': datetime.now().isoformat(),
+                    'status': 'running',
+                    'pooled': True,
+                    'exec_steps': 0
+                }
+            container_info['exec_steps'] += 1
+    
+    def _untrack_pooled_step(self, container_id: str):
+        """Drop a finished exec'd step; the pooled container is untracked once none remain"""
+        with self._containers_lock:
+            container_info = self.active_containers.get(container_id)
+            if container_info is None or not container_info.get('pooled'):
+                return
+            container_info['exec_steps'] -= 1
+            if container_info['exec_steps'] <= 0:
+                del self.active_containers[container_id]
     
     def stop_container(self, container_id: str) -> bool:
         """Stop a specific container"""
         try:
+            client = self._get_docker_client()
+            if client is not None:
+                client.api.stop(container_id)
+                self._untrack_container(container_id)
+                self.logger.info(f"🛑 Stopped container {container_id}")
+                return True
+            
             result = subprocess.run(
                 ["docker", "stop", container_id],
                 capture_output=True, text=True
             )
             if result.returncode == 0:
-                self.active_containers.pop(container_id, None)
+                self._untrack_container(container_id)
                 self.logger.info(f"🛑 Stopped container {container_id}")
                 return True
             else:
@@ -979,23 +1493,20 @@ class ContainerProcessManager:
     def cleanup_failed_containers(self) -> int:
         """Clean up any failed or stuck containers"""
         cleaned = 0
-        for container_id, container_info in list(self.active_containers.items()):
+        for container_id, container_info in self.get_active_containers().items():
             try:
                 # Check if container is still running
-                result = subprocess.run(
-                    ["docker", "inspect", "--format", "{{.State.Status}}", container_id],
-                    capture_output=True, text=True
-                )
+                state = self._get_container_state(container_id)
                 
-                if result.returncode == 0:
-                    status = result.stdout.strip()
-                    if status not in ["running"]:
-                        self.active_containers.pop(container_id, None)
+                if state is not None:
+                    status = state.get('Status')
+                    if status != "running":
+                        self._untrack_container(container_id)
                         cleaned += 1
                         self.logger.info(f"🧹 Cleaned up container {container_id} (status: {status})")
                 else:
                     # Container not found
-                    self.active_containers.pop(container_id, None)
+                    self._untrack_container(container_id)
                     cleaned += 1
                     self.logger.info(f"🧹 Cleaned up missing container {container_id}")
                     
@@ -1005,246 +1516,135 @@ class ContainerProcessManager:
         return cleaned
     
     def _monitor_container_with_fallback(self, container_name: str, container_id: str, 
-                                       tool_name: str, process: subprocess.Popen) -> Tuple[List[str], List[str]]:
+                                       tool_name: str, process: subprocess.Popen,
+                                       log_prefix: Optional[Path] = None) -> Tuple[List[str], List[str]]:
         """
         Robust container monitoring that avoids blocking I/O deadlocks.
         
-        Uses a hybrid approach:
-        1. Try non-blocking real-time monitoring for short periods
-        2. Fall back to docker logs command for reliable output capture
-        3. Monitor container status via docker inspect
+        One reader thread per pipe drains stdout/stderr until EOF, so the
+        container never stalls on a full pipe while we wait for docker run to
+        exit with the container's exit code. With a log_prefix, each stream is
+        also written in full to {log_prefix}.stdout.log / .stderr.log and only
+        the last CAPTURED_OUTPUT_TAIL_LINES lines are returned.
         """
-        stdout_lines = []
-        stderr_lines = []
+        stdout_lines = deque(maxlen=CAPTURED_OUTPUT_TAIL_LINES)
+        stderr_lines = deque(maxlen=CAPTURED_OUTPUT_TAIL_LINES)
+        stdout_log = stderr_log = None
+        if log_prefix is not None:
+            log_prefix.parent.mkdir(parents=True, exist_ok=True)
+            stdout_log = log_prefix.with_name(f"{log_prefix.name}.stdout.log")
+            stderr_log = log_prefix.with_name(f"{log_prefix.name}.stderr.log")
+        
+        readers = [
+            self._start_stream_reader(process.stdout, stdout_lines, tool_name, self.logger.info, stdout_log),
+            self._start_stream_reader(process.stderr, stderr_lines, tool_name, self.logger.warning, stderr_log),
+        ]
         
         try:
-            # Method 1: Try short-term non-blocking monitoring
-            max_realtime_attempts = 30  # 3 seconds of real-time monitoring
-            realtime_attempts = 0
-            
-            while process.poll() is None and realtime_attempts < max_realtime_attempts:
-                # Non-blocking read attempt
-                try:
-                    # Use select for non-blocking I/O on Unix-like systems
-                    import select
-                    ready, _, _ = select.select([process.stdout, process.stderr], [], [], 0.1)
-                    
-                    for stream in ready:
-                        if stream == process.stdout:
-                            line = stream.readline()
-                            if line:
-                                stdout_lines.append(line.rstrip())
-                                self.logger.info(f"[{tool_name}] {line.rstrip()}")
-                        elif stream == process.stderr:
-                            line = stream.readline()
-                            if line:
-                                stderr_lines.append(line.rstrip())
-                                self.logger.warning(f"[{tool_name}] {line.rstrip()}")
-                                
-                except (ImportError, OSError):
-                    # Fallback for Windows or systems without select
-                    break
-                
-                realtime_attempts += 1
-                time.sleep(0.1)
-            
-            # Method 2: Container-based monitoring for long-running processes
-            if process.poll() is None:
-                self.logger.info(f"🔄 Switching to container-based monitoring for {tool_name}")
-                container_stdout, container_stderr = self._monitor_container_via_docker_logs(
-                    container_name, container_id, tool_name, process
-                )
-                stdout_lines.extend(container_stdout)
-                stderr_lines.extend(container_stderr)
-            else:
-                # Process finished during real-time monitoring
-                remaining_stdout, remaining_stderr = process.communicate()
-                stdout_lines.extend(remaining_stdout.splitlines())
-                stderr_lines.extend(remaining_stderr.splitlines())
-                
+            process.wait()
         except Exception as e:
             self.logger.error(f"❌ Error in container monitoring for {tool_name}: {e}")
-            # Fallback: just wait for process to complete
-            try:
-                stdout, stderr = process.communicate(timeout=3600)  # 1 hour timeout
-                stdout_lines.extend(stdout.splitlines())
-                stderr_lines.extend(stderr.splitlines())
-            except subprocess.TimeoutExpired:
-                self.logger.error(f"❌ Container {tool_name} timed out after 1 hour")
-                process.kill()
-                
-        return stdout_lines, stderr_lines
+            process.kill()
+            process.wait()
+        
+        for reader in readers:
+            reader.join()
+        
+        self.logger.info(f"🏁 Container {tool_name} finished with exit_code: {process.returncode}")
+        
+        # docker run has reported the exit code, so the container can be removed
+        if container_id:
+            self._cleanup_container(container_id, tool_name)
+        
+        return list(stdout_lines), list(stderr_lines)
     
-    def _monitor_container_via_docker_logs(self, container_name: str, container_id: str,
-                                         tool_name: str, process: subprocess.Popen) -> Tuple[List[str], List[str]]:
-        """
-        Monitor container via docker logs command instead of subprocess pipes.
-        This avoids the blocking I/O issues with long-running containers.
-        """
-        stdout_lines = []
-        stderr_lines = []
-        last_log_size = 0
-        
-        self.logger.info(f"📊 Starting docker logs monitoring for {tool_name}")
-        
-        # If no container_id, try to get it again
-        if not container_id:
-            container_id = self._get_container_id_by_name(container_name)
-            if not container_id:
-                self.logger.error(f"❌ Cannot monitor container - ID not found for {container_name}")
-                # Fall back to process.communicate()
-                try:
-                    stdout, stderr = process.communicate(timeout=3600)
-                    return stdout.splitlines(), stderr.splitlines()
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    return [], [f"Container {tool_name} timed out"]
+    def _start_stream_reader(self, stream, lines: deque, tool_name: str, log,
+                             log_file: Optional[Path] = None) -> threading.Thread:
+        """Start a thread forwarding a process pipe to a log file, and each line to a bounded deque and the logger"""
+        def _emit(data: bytes):
+            for line in data.decode("utf-8", "replace").splitlines():
+                line = line.rstrip()
+                lines.append(line)
+                log(f"[{tool_name}] {line}")
         
-        while process.poll() is None:
+        def _drain():
+            fd = stream.fileno()
+            pending = bytearray()
+            sink = None
+            if log_file is not None:
+                try:
+                    sink = open(log_file, 'wb', buffering=0)
+                except OSError as e:
+                    self.logger.warning(f"⚠️ Cannot write {tool_name} output to {log_file}: {e}")
             try:
-                # Get container status
-                status_result = subprocess.run([
-                    "docker", "inspect", "--format", "{{.State.Status}}", container_id
-                ], capture_output=True, text=True, timeout=10)
-                
-                if status_result.returncode == 0:
-                    container_status = status_result.stdout.strip()
-                    
-                    if container_status not in ["running"]:
-                        # CORE FIX: Capture exit code before cleaning up
-                        exit_code = self._capture_container_exit_code(container_id, tool_name)
-                        self.logger.info(f"🏁 Container {tool_name} finished with status: {container_status}, exit_code: {exit_code}")
-                        
-                        # Update process returncode if we captured it
-                        if exit_code is not None:
-                            process.returncode = exit_code
-                        
-                        # Clean up container now that we have the exit code
-                        self._cleanup_container(container_id, tool_name)
-                        
-                        break
-                    
-                    # Get container logs
-                    logs_result = subprocess.run([
-                        "docker", "logs", container_id
-                    ], capture_output=True, text=True, timeout=30)
-                    
-                    if logs_result.returncode == 0:
-                        # Process new log lines
-                        all_output = logs_result.stdout + logs_result.stderr
-                        current_lines = all_output.splitlines()
-                        
-                        # Only log new lines since last check
-                        if len(current_lines) > last_log_size:
-                            new_lines = current_lines[last_log_size:]
-                            for line in new_lines:
-                                if line.strip():
-                                    stdout_lines.append(line)
-                                    self.logger.info(f"[{tool_name}] {line}")
-                            last_log_size = len(current_lines)
-                
-                else:
-                    # Container not found, might have finished
-                    self.logger.warning(f"⚠️ Container {container_id} not found, assuming finished")
-                    break
-                    
-            except subprocess.TimeoutExpired:
-                self.logger.warning(f"⚠️ Timeout checking container {tool_name}, continuing...")
-            except Exception as e:
-                self.logger.warning(f"⚠️ Error monitoring container {tool_name}: {e}")
-            
-            time.sleep(5)  # Check every 5 seconds instead of 0.1
-        
-        # Get final logs
-        try:
-            final_logs = subprocess.run([
-                "docker", "logs", container_id
-            ], capture_output=True, text=True, timeout=30)
-            
-            if final_logs.returncode == 0:
-                final_output = final_logs.stdout + final_logs.stderr
-                final_lines = final_output.splitlines()
-                
-                # Add any remaining new lines
-                if len(final_lines) > last_log_size:
-                    remaining_lines = final_lines[last_log_size:]
-                    for line in remaining_lines:
-                        if line.strip():
-                            stdout_lines.append(line)
-                            self.logger.info(f"[{tool_name}] {line}")
-                            
-        except Exception as e:
-            self.logger.warning(f"⚠️ Error getting final logs for {tool_name}: {e}")
+                # Read large blocks and only decode up to the last complete line
+                for chunk in iter(lambda: os.read(fd, PIPE_READ_SIZE), b""):
+                    if sink is not None:
+                        # Raw block straight to disk: one write per pipe read, no per-line work
+                        sink.write(chunk)
+                    pending += chunk
+                    end = pending.rfind(b"\n")
+                    if end >= 0:
+                        _emit(bytes(pending[:end]))
+                        del pending[:end + 1]
+                if pending:
+                    _emit(bytes(pending))
+            finally:
+                if sink is not None:
+                    sink.close()
+                stream.close()
         
-        # Wait for process to complete
-        try:
-            process.wait(timeout=60)  # Wait up to 1 minute for process cleanup
-        except subprocess.TimeoutExpired:
-            self.logger.warning(f"⚠️ Process cleanup timeout for {tool_name}")
-            
-        self.logger.info(f"✅ Container monitoring completed for {tool_name}")
-        return stdout_lines, stderr_lines
+        reader = threading.Thread(target=_drain, name=f"{tool_name}-reader", daemon=True)
+        reader.start()
+        return reader
     
-    def _capture_container_exit_code(self, container_id: str, tool_name: str) -> Optional[int]:
-        """Capture container exit code before cleanup"""
+    def _cleanup_container(self, container_id: str, tool_name: str):
+        """Remove container after capturing exit code"""
         try:
-            result = subprocess.run([
-                "docker", "inspect", "--format", "{{.State.ExitCode}}", container_id
-            ], capture_output=True, text=True, timeout=5)
-            
-            if result.returncode == 0:
-                exit_code_str = result.stdout.strip()
-                exit_code = int(exit_code_str)
-                self.logger.info(f"📋 Captured exit code {exit_code} for {tool_name}")
-                return exit_code
+            client = self._get_docker_client()
+            if client is not None:
+                client.api.remove_container(container_id)
             else:
-                self.logger.warning(f"⚠️ Could not inspect container {container_id}")
-                return None
-                
-        except Exception as e:
-            self.logger.warning(f"⚠️ Error capturing exit code for {tool_name}: {e}")
-            return None
-    
-    def _cleanup_container(self, container_id: str, tool_name: str):
-        """Remove container after capturing exit code"""
-        try:
-            subprocess.run([
-                "docker", "rm", container_id
-            ], capture_output=True, text=True, timeout=10)
+                subprocess.run([
+                    "docker", "rm", container_id
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, timeout=10)
             self.logger.info(f"🧹 Cleaned up container {container_id} for {tool_name}")
         except Exception as e:
             self.logger.warning(f"⚠️ Error cleaning up container {container_id}: {e}")
     
+@dataclass(frozen=True, slots=True)
 class ContainerExecutionResult:
     """Enhanced result of a container execution with detailed tracking information"""
+    success: bool
+    output_files: List[str]
+    error_message: str
+    execution_time: float = 0.0
+    container_id: Optional[str] = None
+    container_name: Optional[str] = None
+    stdout: str = ""
+    stderr: str = ""
+    exit_code: int = 0
+    tool_version: Optional[str] = None
+    memory_used: Optional[str] = None
+    cpu_time: Optional[str] = None
+    # Raw clock reading; only formatted when the result is persisted
+    timestamp_ns: int = field(default_factory=time.time_ns)
     
-    def __init__(self, success: bool, output_files: List[str], error_message: str, 
-                 execution_time: float = 0.0, container_id: str = None, 
-                 container_name: str = None, stdout: str = "", stderr: str = "", 
-                 exit_code: int = 0, tool_version: str = None, 
-                 memory_used: str = None, cpu_time: str = None):
-        self.success = success
-        self.output_files = output_files
-        self.error_message = error_message
-        self.execution_time = execution_time
-        self.container_id = container_id
-        self.container_name = container_name
-        self.stdout = stdout
-        self.stderr = stderr
-        self.exit_code = exit_code
-        self.tool_version = tool_version
-        self.memory_used = memory_used
-        self.cpu_time = cpu_time
-        self.timestamp = datetime.now().isoformat()
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 creation time of the result"""
+        return iso_from_ns(self.timestamp_ns)
 
 
 class WorkflowOrchestrator:
     """Orchestrates the execution of bioinformatics workflows"""
     
-    def __init__(self, data_dir: str, init_docker: bool = True):
+    def __init__(self, data_dir: str, init_docker: bool = True, max_workers: Optional[int] = None):
         self.data_dir = Path(data_dir)
         self.runs_dir = self.data_dir / "runs"
         self.logs_dir = self.data_dir / "logs"
+        # Plain-string form for per-run path joins on the workflow file hot path
+        self._runs_dir_str = os.fspath(self.runs_dir)
         
         # Ensure directories exist
         self.runs_dir.mkdir(parents=True, exist_ok=True)
@@ -1254,43 +1654,325 @@ class WorkflowOrchestrator:
         self._setup_logging()
         
         # Initialize Docker if requested
+        self.docker_client = None
         if init_docker:
             self._init_docker()
             
-        # Initialize container process manager
-        self.container_manager = ContainerProcessManager(self.logger, str(data_dir))
+        # Worker threads shared by DAG steps and step reruns; bounds how many independent steps run at once
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
+        
+        # Initialize container process manager (reuses the orchestrator's Docker connection)
+        self.container_manager = ContainerProcessManager(self.logger, str(data_dir), self.docker_client)
         self.container_manager.start_monitoring()
         
+        # Parsed workflow.yaml per run_id, keyed by the file's (mtime, size)
+        self._wf_cache = {}
+        
+        # run_id -> monotonic expiry for run directories known to lack workflow.yaml
+        self._missing_workflows: Dict[str, float] = {}
+        
+        # (runs_dir mtime_ns, run_ids) from the last directory listing; creating or removing a run bumps the mtime
+        self._run_ids_cache: Optional[Tuple[int, List[str]]] = None
+        
+        # Persistent workflow index shared with other orchestrator processes
+        self._init_workflow_db()
+        
+        # Step pool, sized by max_workers above
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="step")
+        
+        # Background workflow runs queued by submit_pipeline_workflow
+        self._pipeline_executor = ThreadPoolExecutor(max_workers=PIPELINE_WORKERS, thread_name_prefix="pipeline")
+        
+        # Per-run workflow file loads for list_workflows; kept alive so repeated listings reuse their threads
+        self._list_executor = ThreadPoolExecutor(max_workers=LIST_WORKFLOWS_WORKERS, thread_name_prefix="list")
+        
+        # Input fingerprinting for step cache keys; separate from the step pool so hashing can't starve it
+        self._hash_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="hash")
+        
+        # Step result cache for workflows marked cacheable
+        self._init_step_cache()
+        
+        # Check the standard tool images in the background so the first run doesn't wait on the lookups
+        if self.docker_client is not None:
+            self._executor.submit(self.container_manager.warm_images, list(DEFAULT_TOOLS))
+        
+    def _load_workflow_file(self, run_id: str) -> Dict[str, Any]:
+        """Load a run's workflow.yaml, reusing the parsed copy while the file is unchanged"""
+        workflow_file = os.path.join(self._runs_dir_str, run_id, "workflow.yaml")
+        stat = os.stat(workflow_file)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._wf_cache.get(run_id)
+        if cached is None or cached[0] != file_key:
+            # Another process may already have indexed this exact file version
+            workflow = self._workflow_db_lookup(run_id, file_key)
+            if workflow is None:
+                with open(workflow_file, 'rb') as f:
+                    workflow = yaml.load(f, Loader=YamlLoader)
+                self._workflow_db_store(run_id, workflow, file_key)
+            # Every run repeats the same few tool names; share one string object per name across cached runs
+            tools = workflow.get("tools")
+            if isinstance(tools, list):
+                workflow["tools"] = [sys.intern(tool) if isinstance(tool, str) else tool for tool in tools]
+            cached = (file_key, workflow)
+            self._wf_cache[run_id] = cached
+        
+        # Shallow copy so callers can add keys without touching the cache
+        return dict(cached[1])
+    
+    def _save_workflow_file(self, run_id: str, workflow: Dict[str, Any]):
+        """Atomically replace a run's workflow.yaml and refresh the parsed cache"""
+        workflow_file = self.runs_dir / run_id / "workflow.yaml"
+        # Write beside the target and rename so concurrent readers never see a torn file
+        tmp_file = workflow_file.with_name(f"workflow.yaml.{os.getpid()}.{threading.get_ident()}.tmp")
+        # Render first and hand the whole document to the kernel in one write instead of libyaml's small chunks;
+        # keys keep their insertion order rather than being re-sorted on every save
+        data = yaml.dump(workflow, Dumper=YamlDumper, default_flow_style=False, sort_keys=False).encode()
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, workflow_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        stat = workflow_file.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        self._wf_cache[run_id] = (file_key, dict(workflow))
+        self._missing_workflows.pop(run_id, None)
+        self._workflow_db_store(run_id, workflow, file_key)
+        self._write_workflow_sidecar(workflow_file, workflow, file_key)
+    
+    def _write_workflow_sidecar(self, workflow_file: Path, workflow: Dict[str, Any], file_key: Tuple[int, int]):
+        """Mirror workflow.yaml as workflow.json for readers outside this process, stamped with the YAML version it matches"""
+        sidecar = workflow_file.with_suffix(".json")
+        tmp_file = sidecar.with_name(f"workflow.json.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_file.write_bytes(orjson.dumps(
+                {"source": {"mtime_ns": file_key[0], "size": file_key[1]}, "workflow": workflow},
+                default=str, option=orjson.OPT_NON_STR_KEYS
+            ))
+            os.replace(tmp_file, sidecar)
+        except Exception as e:
+            tmp_file.unlink(missing_ok=True)
+            self.logger.warning(f"⚠️ Failed to write {sidecar}: {e}")
+    
+    def _init_workflow_db(self):
+        """Open the workflows index database (WAL, so status polls never block writers)"""
+        self._workflow_db_lock = threading.Lock()
+        self._workflow_db = sqlite3.connect(
+            str(self.data_dir / "workflows.db"), check_same_thread=False, isolation_level=None
+        )
+        self._workflow_db.execute("PRAGMA journal_mode=WAL")
+        self._workflow_db.execute(
+            """CREATE TABLE IF NOT EXISTS workflows (
+                run_id TEXT PRIMARY KEY,
+                workflow_name TEXT,
+                status TEXT,
+                tools TEXT,
+                created_at TEXT,
+                completed_at TEXT,
+                execution_time REAL,
+                file_mtime_ns INTEGER,
+                file_size INTEGER,
+                workflow TEXT
+            )"""
+        )
+    
+    def _workflow_db_lookup(self, run_id: str, file_key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Get the indexed workflow if it was recorded from the same workflow.yaml version"""
+        try:
+            with self._workflow_db_lock:
+                row = self._workflow_db.execute(
+                    "SELECT workflow FROM workflows WHERE run_id = ? AND file_mtime_ns = ? AND file_size = ?",
+                    (run_id, file_key[0], file_key[1])
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️ Workflow index lookup failed for {run_id}: {e}")
+            return None
+        return orjson.loads(row[0]) if row else None
+    
+    def _workflow_db_store(self, run_id: str, workflow: Dict[str, Any], file_key: Tuple[int, int]):
+        """Index a workflow; workflow.yaml stays the source of truth"""
+        if not isinstance(workflow, dict):
+            return
+        try:
+            tools = orjson.dumps(workflow.get("tools", []), default=str).decode()
+            created_at, completed_at = (
+                str(workflow[key]) if workflow.get(key) is not None else None
+                for key in ("created_at", "completed_at")
+            )
+            payload = orjson.dumps(workflow, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+            with self._workflow_db_lock:
+                self._workflow_db.execute(
+                    "INSERT OR REPLACE INTO workflows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, workflow.get("workflow_name"), workflow.get("status"), tools,
+                     created_at, completed_at,
+                     workflow.get("execution_time"), file_key[0], file_key[1], payload)
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.warning(f"⚠️ Failed to index workflow {run_id}: {e}")
+    
+    def _init_step_cache(self):
+        """Open the step cache database that memoizes tool results by input hash"""
+        self._step_cache_lock = threading.Lock()
+        self._step_cache = sqlite3.connect(str(self.data_dir / "step_cache.sqlite"), check_same_thread=False)
+        self._step_cache.execute(
+            """CREATE TABLE IF NOT EXISTS step_cache (
+                step_hash TEXT PRIMARY KEY,
+                tool_name TEXT,
+                output_dir TEXT,
+                output_files TEXT,
+                stdout TEXT,
+                stderr TEXT,
+                exit_code INTEGER,
+                created_at TEXT
+            )"""
+        )
+        self._step_cache.commit()
+    
+    def _is_step_cacheable(self, workflow_config: Dict[str, Any], tool_name: str) -> bool:
+        """Check whether the workflow marks a tool as pure, so its results may be reused"""
+        cacheable = (workflow_config or {}).get('cacheable', False)
+        if isinstance(cacheable, list):
+            return tool_name in cacheable
+        return bool(cacheable)
+    
+    def _is_step_checkpointed(self, workflow_config: Dict[str, Any], tool_name: str) -> bool:
+        """Check whether a finished tool's progress is written to the checkpoint log (default: every tool)"""
+        # Opting a tool out means a resumed run repeats it; keep non-deterministic tools checkpointed
+        checkpoint = (workflow_config or {}).get('checkpoint', True)
+        if isinstance(checkpoint, list):
+            return tool_name in checkpoint
+        return bool(checkpoint)
+    
+    def _compute_step_hash(self, tool_name: str, inputs: List[str], tool_config: Dict[str, Any]) -> Optional[str]:
+        """Hash tool, image, config and input file contents into a step cache key"""
+        # Hash the inputs in parallel while the image is inspected
+        fingerprints = [self._hash_executor.submit(self._fingerprint_file, input_file) for input_file in inputs]
+        image_id = self.container_manager.get_image_id(tool_name)
+        if not image_id:
+            for future in fingerprints:
+                future.cancel()
+            return None
+        
+        hasher = hashlib.blake2b()
+        hasher.update(tool_name.encode())
+        hasher.update(image_id.encode())
+        config = {k: v for k, v in tool_config.items() if k not in STEP_CACHE_IGNORED_CONFIG}
+        hasher.update(json.dumps(config, sort_keys=True, default=str).encode())
+        
+        try:
+            for input_file, future in zip(inputs, fingerprints):
+                hasher.update(os.path.basename(input_file).encode())
+                hasher.update(future.result().encode())
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Cannot fingerprint inputs for {tool_name}, skipping step cache: {e}")
+            return None
+        
+        return hasher.hexdigest()
+    
+    def _fingerprint_file(self, path: str) -> str:
+        """Fingerprint an input file by content, or by size and mtime when it is very large"""
+        stat = os.stat(path)
+        if stat.st_size > STAT_FINGERPRINT_THRESHOLD:
+            return f"stat:{stat.st_size}:{stat.st_mtime_ns}"
+        
+        with open(path, 'rb') as f:
+            if blake3 is not None:
+                if stat.st_size == 0:
+                    return blake3().hexdigest()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return blake3(mm, max_threads=blake3.AUTO).hexdigest()
+            
+            # readinto() a reused buffer inside hashlib, no per-block bytes objects
+            return hashlib.file_digest(f, hashlib.blake2b).hexdigest()
+    
+    def _cache_lookup(self, step_hash: str) -> Optional[Dict[str, Any]]:
+        """Get a cached step result whose output files still exist"""
+        with self._step_cache_lock:
+            row = self._step_cache.execute(
+                "SELECT output_dir, output_files, stdout, stderr, exit_code FROM step_cache WHERE step_hash = ?",
+                (step_hash,)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        output_dir, output_files, stdout, stderr, exit_code = row
+        output_files = orjson.loads(output_files)
+        if not all(os.path.isfile(f) for f in output_files):
+            return None
+        return {
+            'output_dir': output_dir,
+            'output_files': output_files,
+            'stdout': stdout,
+            'stderr': stderr,
+            'exit_code': exit_code
+        }
+    
+    def _cache_store(self, step_hash: str, tool_name: str, output_dir: str, result: 'ContainerExecutionResult'):
+        """Record a successful step result in the step cache"""
+        # Keep a private copy (reflinked where possible) under step_cache/<hash>/ so the entry outlives its run
+        # and a later run rewriting its step directory in place can't change the cached bytes
+        output_files = result.output_files
+        try:
+            cache_dir = self.data_dir / "step_cache" / step_hash
+            output_files = self._restore_cached_outputs(
+                {'output_dir': output_dir, 'output_files': output_files}, cache_dir
+            )
+            output_dir = str(cache_dir)
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not keep cached outputs for {tool_name}, caching them in place: {e}")
+        
+        with self._step_cache_lock:
+            self._step_cache.execute(
+                "INSERT OR REPLACE INTO step_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (step_hash, tool_name, output_dir, orjson.dumps(output_files).decode(),
+                 result.stdout, result.stderr, result.exit_code, datetime.now().isoformat())
+            )
+            self._step_cache.commit()
+    
+    def _restore_cached_outputs(self, cached: Dict[str, Any], tool_output_dir: Path) -> List[str]:
+        """Copy cached output files into a step output directory, reflinking where the filesystem allows"""
+        # No hardlinks: a tool reopening an output with O_TRUNC would rewrite the shared inode
+        restored = []
+        for cached_file in cached['output_files']:
+            dest_file = tool_output_dir / os.path.relpath(cached_file, cached['output_dir'])
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            dest_file.unlink(missing_ok=True)
+            kernel_copy_file(cached_file, dest_file)
+            restored.append(str(dest_file))
+        return restored
+        
     def _init_docker(self):
         """Initialize Docker environment"""
         try:
-            # Check if Docker is available
-            result = subprocess.run(["docker", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.logger.info(f"✅ Docker available: {result.stdout.strip()}")
-            else:
-                self.logger.warning("⚠️  Docker not available")
-        except FileNotFoundError:
-            self.logger.warning("⚠️  Docker command not found")
+            # Check if Docker is available over the daemon API
+            client = _load_docker().from_env(timeout=30, max_pool_size=DOCKER_MAX_POOL_SIZE)
+            client.ping()
+            self.docker_client = client
+            self.logger.info(f"✅ Docker available: {client.version().get('Version', 'unknown version')}")
+        except Exception as e:
+            self.logger.warning(f"⚠️  Docker not available: {e}")
             
     def _setup_logging(self):
         """Setup basic logging for the orchestrator"""
         # Create orchestrator logger
-        self.logger = logging.getLogger("orchestrator")
+        self.logger = logger
         self.logger.setLevel(logging.INFO)
         
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        # Shared by every instance; the portal builds an orchestrator per request
+        _start_console_logging()
         
         # Prevent duplicate logs
         self.logger.propagate = False
         
         # Initialize issues logger
-        self.issues_logger = IssuesLogger()
+        self.issues_logger = IssuesLogger(self.data_dir / "issues_overflow.jsonl")
         
     def _filter_files_for_tool(self, files: List[str], tool_name: str) -> List[str]:
         """Filter files based on tool's accepted input formats"""
@@ -1346,7 +2028,7 @@ class WorkflowOrchestrator:
                     filtered_files.append(file_path)
                     self.logger.info(f"Including file for {tool_name}: {file_path_obj.name}")
                 else:
-                    self.logger.debug(f"Excluding file for {tool_name}: {file_path_obj.name} (format not supported)")
+                    self.logger.debug("Excluding file for %s: %s (format not supported)", tool_name, file_path_obj.name)
             
             if not filtered_files:
                 self.logger.warning(f"No files match accepted formats for {tool_name}. Accepted: {accepted_formats}")
@@ -1366,8 +2048,30 @@ class WorkflowOrchestrator:
             # Fallback: return original files to avoid breaking workflow
             return files
     
+    def _find_reference_files(self, original_inputs: List[str]) -> List[str]:
+        """Pick out the reference files (FASTA, but not FASTQ) among a run's original inputs"""
+        reference_files = []
+        for original_file in original_inputs:
+            file_path = Path(original_file)
+            file_ext = file_path.suffix.upper()
+            file_name = file_path.name.upper()
+            
+            # Identify reference files (FASTA, but not FASTQ)
+            is_reference = False
+            if file_ext in ['.FASTA', '.FA', '.FAS'] and file_ext not in ['.FASTQ', '.FQ']:
+                is_reference = True
+            elif 'FASTA' in file_name and 'FASTQ' not in file_name:
+                is_reference = True
+            elif any(keyword in file_name for keyword in ['TARGET', 'REFERENCE', 'REF', 'GENES']):
+                is_reference = True
+            
+            if is_reference:
+                reference_files.append(original_file)
+        return reference_files
+    
     def _prepare_universal_inputs(self, tool_name: str, current_inputs: List[str], 
-                                 original_inputs: List[str], step_number: int) -> List[str]:
+                                 original_inputs: List[str], reference_files: List[str],
+                                 step_number: int) -> List[str]:
         """
         UNIVERSAL SOLUTION: Prepare inputs for tools that need both processed and reference files
         
@@ -1379,28 +2083,15 @@ class WorkflowOrchestrator:
                 # First tool gets all original inputs
                 return original_inputs
             
-            # For subsequent tools, combine processed files with reference files
+            # For subsequent tools, combine processed files with the run's reference files
             combined_inputs = current_inputs.copy()
+            present = set(current_inputs)
             
-            # Add reference files (FASTA files that aren't FASTQ) from original inputs
-            for original_file in original_inputs:
-                file_path = Path(original_file)
-                file_ext = file_path.suffix.upper()
-                file_name = file_path.name.upper()
-                
-                # Identify reference files (FASTA, but not FASTQ)
-                is_reference = False
-                if file_ext in ['.FASTA', '.FA', '.FAS'] and file_ext not in ['.FASTQ', '.FQ']:
-                    is_reference = True
-                elif 'FASTA' in file_name and 'FASTQ' not in file_name:
-                    is_reference = True
-                elif any(keyword in file_name for keyword in ['TARGET', 'REFERENCE', 'REF', 'GENES']):
-                    is_reference = True
-                
-                # Add reference files to inputs if not already present
-                if is_reference and original_file not in combined_inputs:
-                    combined_inputs.append(original_file)
-                    self.logger.info(f"🔗 Added reference file for {tool_name}: {file_path.name}")
+            # Add reference files to inputs if not already present
+            for reference_file in reference_files:
+                if reference_file not in present:
+                    combined_inputs.append(reference_file)
+                    self.logger.info(f"🔗 Added reference file for {tool_name}: {os.path.basename(reference_file)}")
             
             return combined_inputs
             
@@ -1428,9 +2119,11 @@ class WorkflowOrchestrator:
             }
             
             # Save workflow definition
-            workflow_file = run_dir / "workflow.yaml"
-            with open(workflow_file, 'w') as f:
-                yaml.dump(workflow, f, default_flow_style=False)
+            self._save_workflow_file(run_id, workflow)
+            
+            # Check tool images in the background so a missing one surfaces before the run starts
+            if self.docker_client is not None:
+                self._executor.submit(self.container_manager.warm_images, tools)
                 
             self.logger.info(f"✅ Created workflow run: {run_id}")
             return workflow
@@ -1440,18 +2133,26 @@ class WorkflowOrchestrator:
             raise
             
     def execute_pipeline_workflow_enhanced(self, run_id: str, input_files: List[str], 
-                                          workflow_config: Dict[str, Any]) -> bool:
+                                          workflow_config: Dict[str, Any],
+                                          checkpoint: Optional[Dict[str, Any]] = None) -> bool:
         """Enhanced pipeline workflow execution with container-based processing"""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        # Progress so far, reported by the crash handler below
+        step_number = 1
+        tool_name = "unknown"
+        tool_output_dir = "unknown"
+        current_inputs = []
+        tools = []
+        workflow_logger = None
+        self.container_manager.acquire_pool(run_id)
         
         try:
             # Load workflow definition
-            workflow_file = self.runs_dir / run_id / "workflow.yaml"
-            if not workflow_file.exists():
-                raise FileNotFoundError(f"Workflow file not found: {workflow_file}")
-                
-            with open(workflow_file, 'r') as f:
-                workflow = yaml.safe_load(f)
+            try:
+                workflow = self._load_workflow_file(run_id)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Workflow file not found: {self.runs_dir / run_id / 'workflow.yaml'}") from None
                 
             # Initialize dynamic logger
             workflow_logger = DynamicWorkflowLogger(run_id, workflow.get("workflow_name", "Unknown"), str(self.data_dir))
@@ -1460,73 +2161,90 @@ class WorkflowOrchestrator:
             tools = workflow.get("tools", [])
             workflow_logger.log_workflow_start(workflow.get("workflow_name", "Unknown"), tools, len(tools))
             
-            # Handle input files
+            # Handle input files (step_results/ is created here once instead of on every step save)
             inputs_dir = self.runs_dir / run_id / "inputs"
             inputs_dir.mkdir(exist_ok=True)
+            (self.runs_dir / run_id / "step_results").mkdir(exist_ok=True)
             
             copied_files = []
             for input_file in input_files:
                 input_path = Path(input_file)
-                if input_path.exists():
-                    if str(input_path).startswith(str(inputs_dir)):
-                        copied_files.append(str(input_path))
-                        workflow_logger.log_step_progress(1, "file_copy", f"Using existing file: {input_path}")
-                    else:
-                        dest_file = inputs_dir / input_path.name
-                        shutil.copy2(input_file, dest_file)
-                        copied_files.append(str(dest_file))
-                        workflow_logger.log_step_progress(1, "file_copy", f"Copied {input_file} to {dest_file}")
-                else:
+                # One stat answers "exists?" and gives the size for the log line
+                try:
+                    input_size = os.stat(input_path).st_size
+                except OSError:
                     workflow_logger.log_step_progress(1, "file_copy", f"Input file not found: {input_file}", "WARNING")
+                    continue
+                # Compare directories by identity: spelling differences (relative paths, symlinks, "./")
+                # must not send a file already in inputs/ through the unlink-and-link path below
+                if os.path.samefile(input_path.parent, inputs_dir):
+                    copied_files.append(str(input_path))
+                    workflow_logger.log_step_progress(1, "file_copy", f"Using existing file: {input_path}")
+                else:
+                    dest_file = inputs_dir / input_path.name
+                    strategy = self._link_or_copy_input(input_path, dest_file)
+                    copied_files.append(str(dest_file))
+                    workflow_logger.log_step_progress(1, "file_copy", f"{strategy} {input_file} to {dest_file} ({input_size} bytes)")
                     
             # Execute each tool in the pipeline using container manager
-            current_inputs = copied_files
             original_inputs = copied_files.copy()  # Keep original files for reference
-            step_number = 1
-            step_results = []
-            
-            for tool_name in tools:
+            # Reference files are classified once per run; every later step reuses the same list
+            reference_files = self._find_reference_files(original_inputs)
+            depends = workflow.get("depends")
+            
+            inputs_fingerprint = self._fingerprint_inputs(original_inputs)
+            if checkpoint is not None and checkpoint.get('inputs_fingerprint') != inputs_fingerprint:
+                workflow_logger.log_step_progress(1, "resume", 
+                    "Input files changed since the checkpoint was written, restarting from the first step.", "WARNING")
+                checkpoint = None
+            if checkpoint is None:
+                # A fresh run must not inherit progress events from an earlier attempt
+                (self.runs_dir / run_id / "checkpoint.jsonl").unlink(missing_ok=True)
+                self._checkpoint(run_id, {
+                    'original_inputs': original_inputs,
+                    'inputs_fingerprint': inputs_fingerprint
+                })
+            
+            if depends:
+                # Steps with declared dependencies run as a DAG, independent steps concurrently
                 try:
-                    # Create tool output directory
-                    tool_output_dir = self.runs_dir / run_id / f"step_{step_number}_{tool_name}"
-                    tool_output_dir.mkdir(exist_ok=True)
-                    
-                    # UNIVERSAL SOLUTION: Provide both processed files and reference files
-                    tool_inputs = self._prepare_universal_inputs(tool_name, current_inputs, original_inputs, step_number)
-                    
-                    # Log step start
-                    workflow_logger.log_step_start(step_number, tool_name, tool_inputs, str(tool_output_dir))
-                    
-                    # Execute tool using container manager
-                    tool_config = {
-                        'step_number': step_number,
-                        'workflow_id': run_id
-                        # No timeout - let tools run as long as needed
-                    }
-                    
-                    result = self.container_manager.execute_tool_in_container(
-                        tool_name, tool_inputs, str(tool_output_dir), 
-                        run_id, step_number, tool_config
+                    step_results = self._execute_workflow_dag(
+                        run_id, tools, depends, original_inputs, workflow_config, workflow_logger,
+                        completed_steps=(checkpoint or {}).get('completed_steps')
                     )
-                    
-                    # Store step result for rerun capability
-                    step_result = {
-                        'step_number': step_number,
-                        'tool_name': tool_name,
-                        'input_files': current_inputs,
-                        'output_dir': str(tool_output_dir),
-                        'result': result,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    step_results.append(step_result)
-                    
-                    # Save step result for rerun capability
-                    self._save_step_result(run_id, step_result)
-                    
-                    # Log step completion
-                    workflow_logger.log_step_completion(step_number, tool_name, result)
-                    
-                    if result.success:
+                except Exception as e:
+                    workflow_logger.log_error(e, "Workflow step execution")
+                    self._finish_failed_workflow_step(run_id, workflow_logger, start_time)
+                    return False
+            else:
+                current_inputs = copied_files
+                step_number = 1
+                step_results = []
+                
+                if (checkpoint and checkpoint.get('step_number')
+                        and all(os.path.exists(f) for f in checkpoint['current_inputs'])):
+                    # Skip steps that completed before the previous run stopped
+                    current_inputs = checkpoint['current_inputs']
+                    step_number = checkpoint['step_number'] + 1
+                    workflow_logger.log_step_progress(step_number, "resume", 
+                        f"Resuming from checkpoint after step {checkpoint['step_number']} with {len(current_inputs)} input files.")
+                
+                for tool_name in tools[step_number - 1:]:
+                    # Same directory _execute_workflow_step writes to; kept here for the crash report
+                    tool_output_dir = str(self.runs_dir / run_id / f"step_{step_number}_{tool_name}")
+                    try:
+                        # UNIVERSAL SOLUTION: Provide both processed files and reference files
+                        tool_inputs = self._prepare_universal_inputs(
+                            tool_name, current_inputs, original_inputs, reference_files, step_number
+                        )
+                        
+                        step_result = self._execute_workflow_step(
+                            run_id, step_number, tool_name, tool_inputs, current_inputs,
+                            workflow_config, workflow_logger
+                        )
+                        step_results.append(step_result)
+                        result = step_result['result']
+                        
                         # Filter output files for next step based on next tool's requirements
                         if step_number < len(tools):
                             next_tool = tools[step_number]
@@ -1541,6 +2259,12 @@ class WorkflowOrchestrator:
                             workflow_logger.log_step_progress(step_number, tool_name, 
                                 f"Tool completed successfully. Output files: {len(result.output_files)}")
                         
+                        # A cache hit is replayed just as cheaply on resume, so it doesn't need its own event
+                        if not step_result['cache_hit'] and self._is_step_checkpointed(workflow_config, tool_name):
+                            self._checkpoint(run_id, {
+                                'step_number': step_number,
+                                'current_inputs': current_inputs
+                            })
                         step_number += 1
                         
                         # Log that we're ready for the next step
@@ -1548,29 +2272,14 @@ class WorkflowOrchestrator:
                             next_tool = tools[step_number-1]
                             workflow_logger.log_step_progress(step_number, next_tool, 
                                 f"Previous step completed successfully. Ready to start {next_tool} with {len(current_inputs)} input files.")
-                    else:
-                        # Tool failed - provide rerun information
-                        workflow_logger.log_step_progress(step_number, tool_name, 
-                            f"Tool failed: {result.error_message}", "ERROR")
-                        
-                        # Log rerun information
-                        self._log_rerun_information(run_id, step_number, tool_name, result, workflow_logger)
                         
-                        raise RuntimeError(f"Tool {tool_name} failed: {result.error_message}")
-                    
-                except Exception as e:
-                    workflow_logger.log_error(e, f"Step {step_number} execution")
-                    workflow_logger.log_workflow_completion(False, time.time() - start_time)
-                    
-                    # Save enhanced issues analysis for failed workflow
-                    run_dir = self.runs_dir / run_id
-                    workflow_logger.save_enhanced_issues_log(run_id, run_dir)
-                    
-                    workflow_logger.cleanup()
-                    return False
+                    except Exception as e:
+                        workflow_logger.log_error(e, f"Step {step_number} execution")
+                        self._finish_failed_workflow_step(run_id, workflow_logger, start_time)
+                        return False
                     
             # Workflow completed successfully
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             workflow_logger.log_workflow_completion(True, total_time)
             
             # Save enhanced issues analysis
@@ -1583,6 +2292,9 @@ class WorkflowOrchestrator:
             # Save workflow execution summary
             self._save_workflow_execution_summary(run_id, step_results, total_time)
             
+            # A finished run has nothing left to resume
+            (run_dir / "checkpoint.jsonl").unlink(missing_ok=True)
+            
             # Cleanup logger
             workflow_logger.cleanup()
             
@@ -1590,22 +2302,23 @@ class WorkflowOrchestrator:
             return True
             
         except Exception as e:
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             self.logger.error(f"❌ Workflow {run_id} failed: {e}")
             
             # Enhanced crash logging with detailed diagnostics
             crash_details = {
                 "error_type": type(e).__name__,
                 "error_message": str(e),
-                "last_completed_step": step_number - 1 if 'step_number' in locals() else 0,
-                "last_tool": tool_name if 'tool_name' in locals() else "unknown",
+                "last_completed_step": step_number - 1,
+                "last_tool": tool_name,
                 "execution_time": total_time,
-                "stack_trace": traceback.format_exc(),
+                # Frames are captured without reading source lines; text is built on first use
+                "stack_trace_obj": traceback.TracebackException.from_exception(e, lookup_lines=False),
                 "workflow_state": {
-                    "total_steps": len(tools) if 'tools' in locals() else 0,
-                    "completed_steps": step_number - 1 if 'step_number' in locals() else 0,
-                    "current_inputs": current_inputs if 'current_inputs' in locals() else [],
-                    "last_output_dir": tool_output_dir if 'tool_output_dir' in locals() else "unknown"
+                    "total_steps": len(tools),
+                    "completed_steps": step_number - 1,
+                    "current_inputs": current_inputs,
+                    "last_output_dir": tool_output_dir
                 }
             }
             
@@ -1616,11 +2329,11 @@ class WorkflowOrchestrator:
             self.logger.error(f"   Execution time: {total_time:.2f} seconds")
             self.logger.error(f"   Error type: {crash_details['error_type']}")
             self.logger.error(f"   Error message: {crash_details['error_message']}")
-            self.logger.error(f"   Stack trace: {crash_details['stack_trace']}")
+            self.logger.error(f"   Stack trace: {format_crash_stack_trace(crash_details)}")
             
             # Try to log completion if logger exists
             try:
-                if 'workflow_logger' in locals():
+                if workflow_logger is not None:
                     workflow_logger.log_workflow_completion(False, total_time)
                     
                     # Save enhanced issues analysis for failed workflow with crash details
@@ -1635,40 +2348,314 @@ class WorkflowOrchestrator:
             self._update_workflow_status(run_id, "failed", total_time)
             
             return False
+        
+        finally:
+            # Pooled containers only live while some caller is running this workflow's steps
+            self.container_manager.release_pool(run_id)
             
-    def _update_workflow_status(self, run_id: str, status: str, execution_time: float):
-        """Update workflow status in the workflow file"""
+    def _checkpoint(self, run_id: str, event: Dict[str, Any]):
+        """Append one progress event to the run's checkpoint log so a crashed run can be resumed"""
+        try:
+            checkpoint_log = self.runs_dir / run_id / "checkpoint.jsonl"
+            event['checkpointed_at'] = datetime.now().isoformat()
+            # One O_APPEND write per event: O(1) per step instead of rewriting all progress so far
+            fd = os.open(checkpoint_log, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE))
+            finally:
+                os.close(fd)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to write checkpoint for {run_id}: {e}")
+    
+    def _fingerprint_inputs(self, input_files: List[str]) -> Optional[str]:
+        """Hash input names, sizes and mtimes so a resume can tell whether its inputs changed"""
+        hasher = hashlib.blake2b()
         try:
-            workflow_file = self.runs_dir / run_id / "workflow.yaml"
-            if workflow_file.exists():
-                with open(workflow_file, 'r') as f:
-                    workflow = yaml.safe_load(f)
+            for input_file in sorted(input_files):
+                stat = os.stat(input_file)
+                hasher.update(f"{os.path.basename(input_file)}:{stat.st_size}:{stat.st_mtime_ns}\0".encode())
+        except OSError:
+            return None
+        return hasher.hexdigest()
+    
+    def _read_checkpoint(self, run_id: str) -> Dict[str, Any]:
+        """Replay a run's checkpoint log into the latest progress state"""
+        state = {}
+        completed_steps = {}
+        with open(self.runs_dir / run_id / "checkpoint.jsonl", 'rb') as f:
+            for line in f:
+                try:
+                    event = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A crash mid-append leaves a torn final line
+                    self.logger.warning(f"⚠️ Ignoring truncated checkpoint event for {run_id}")
+                    break
+                completed_steps.update(event.pop('completed_steps', {}))
+                state.update(event)
+        if completed_steps:
+            state['completed_steps'] = completed_steps
+        return state
+    
+    def resume_pipeline_workflow(self, run_id: str, workflow_config: Optional[Dict[str, Any]] = None) -> bool:
+        """Resume a crashed or failed workflow from its last checkpoint, skipping completed steps"""
+        try:
+            checkpoint = self._read_checkpoint(run_id)
+        except FileNotFoundError:
+            self.logger.error(f"❌ No checkpoint found for workflow {run_id}")
+            return False
+        except Exception as e:
+            self.logger.error(f"❌ Failed to read checkpoint for workflow {run_id}: {e}")
+            return False
+        
+        if workflow_config is None:
+            workflow_config = self._load_workflow_file(run_id)
+        
+        self.logger.info(f"🔄 Resuming workflow {run_id} from checkpoint")
+        return self.execute_pipeline_workflow_enhanced(
+            run_id, checkpoint.get('original_inputs', []), workflow_config, checkpoint=checkpoint
+        )
+    
+    def submit_pipeline_workflow(self, run_id: str, input_files: List[str],
+                                 workflow_config: Dict[str, Any]) -> Future:
+        """Queue a workflow for background execution and return immediately; poll get_workflow_status for progress"""
+        self._mark_workflow(run_id, "queued", "queued_at")
+        self.logger.info(f"📥 Queued workflow {run_id} for background execution")
+        return self._pipeline_executor.submit(self._run_queued_pipeline, run_id, input_files, workflow_config)
+    
+    def _run_queued_pipeline(self, run_id: str, input_files: List[str], workflow_config: Dict[str, Any]) -> bool:
+        """Execute a queued workflow, keeping its status current for pollers"""
+        self._mark_workflow(run_id, "running", "started_at")
+        start_time = time.perf_counter()
+        success = False
+        try:
+            success = self.execute_pipeline_workflow_enhanced(run_id, input_files, workflow_config)
+        finally:
+            if not success:
+                self._update_workflow_status(run_id, "failed", time.perf_counter() - start_time)
+        return success
+    
+    def _mark_workflow(self, run_id: str, status: str, timestamp_key: str):
+        """Record a status and when it was reached in a run's workflow.yaml"""
+        try:
+            workflow = self._load_workflow_file(run_id)
+            workflow["status"] = status
+            workflow[timestamp_key] = datetime.now().isoformat()
+            self._save_workflow_file(run_id, workflow)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not mark workflow {run_id} as {status}: {e}")
+    
+    def _link_or_copy_input(self, source: Path, dest: Path) -> str:
+        """Place an input file in the run's inputs directory, avoiding a byte copy where possible"""
+        dest.unlink(missing_ok=True)
+        
+        # Same filesystem: a hardlink is free and tools only read their inputs
+        try:
+            os.link(source, dest)
+            return "Hardlinked"
+        except OSError:
+            pass
+        
+        return kernel_copy_file(source, dest)
+    
+    def _execute_workflow_step(self, run_id: str, step_number: int, tool_name: str,
+                               tool_inputs: List[str], current_inputs: List[str],
+                               workflow_config: Dict[str, Any],
+                               workflow_logger: DynamicWorkflowLogger) -> Dict[str, Any]:
+        """Execute a single workflow step and record its result; raises if the tool fails"""
+        # Create tool output directory
+        tool_output_dir = self.runs_dir / run_id / f"step_{step_number}_{tool_name}"
+        tool_output_dir.mkdir(exist_ok=True)
+        
+        # Log step start
+        workflow_logger.log_step_start(step_number, tool_name, tool_inputs, str(tool_output_dir))
+        
+        # Execute tool using container manager
+        tool_config = {
+            'step_number': step_number,
+            'workflow_id': run_id
+            # No timeout - let tools run as long as needed
+        }
+        
+        # Reuse the result of an identical earlier run for cacheable tools
+        step_hash = None
+        cached = None
+        if self._is_step_cacheable(workflow_config, tool_name):
+            step_hash = self._compute_step_hash(tool_name, tool_inputs, tool_config)
+            cached = self._cache_lookup(step_hash) if step_hash else None
+        
+        if cached:
+            result = ContainerExecutionResult(
+                success=True,
+                output_files=self._restore_cached_outputs(cached, tool_output_dir),
+                error_message="",
+                execution_time=0.0,
+                stdout=cached['stdout'],
+                stderr=cached['stderr'],
+                exit_code=cached['exit_code']
+            )
+            workflow_logger.log_step_progress(step_number, tool_name, 
+                f"Reused cached result from {cached['output_dir']}")
+        else:
+            result = self.container_manager.execute_tool_in_container(
+                tool_name, tool_inputs, str(tool_output_dir), 
+                run_id, step_number, tool_config
+            )
+            if step_hash and result.success:
+                self._cache_store(step_hash, tool_name, str(tool_output_dir), result)
+        
+        # Store step result for rerun capability
+        step_result = {
+            'step_number': step_number,
+            'tool_name': tool_name,
+            'input_files': current_inputs,
+            'output_dir': str(tool_output_dir),
+            'result': result,
+            'cache_hit': bool(cached),
+            'timestamp_ns': time.time_ns()
+        }
+        
+        # Save step result for rerun capability
+        self._save_step_result(run_id, step_result)
+        
+        # Log step completion
+        workflow_logger.log_step_completion(step_number, tool_name, result)
+        
+        if not result.success:
+            # Tool failed - provide rerun information
+            workflow_logger.log_step_progress(step_number, tool_name, 
+                f"Tool failed: {result.error_message}", "ERROR")
+            
+            # Log rerun information
+            self._log_rerun_information(run_id, step_number, tool_name, result, workflow_logger)
+            
+            raise RuntimeError(f"Tool {tool_name} failed: {result.error_message}")
+        
+        return step_result
+    
+    def _execute_workflow_dag(self, run_id: str, tools: List[str], depends: Dict[str, List[str]],
+                              original_inputs: List[str], workflow_config: Dict[str, Any],
+                              workflow_logger: DynamicWorkflowLogger,
+                              completed_steps: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, Any]]:
+        """Execute workflow steps in dependency order, running steps whose dependencies are met concurrently"""
+        step_numbers = {tool_name: i for i, tool_name in enumerate(tools, 1)}
+        if len(step_numbers) != len(tools):
+            raise ValueError("Workflows using 'depends' must not repeat tool names")
+        
+        graph = {}
+        for tool_name in tools:
+            dependencies = depends.get(tool_name) or []
+            unknown = set(dependencies) - step_numbers.keys()
+            if unknown:
+                raise ValueError(f"Tool {tool_name} depends on unknown tools: {', '.join(sorted(unknown))}")
+            graph[tool_name] = dependencies
+        
+        sorter = graphlib.TopologicalSorter(graph)
+        sorter.prepare()
+        
+        reference_files = self._find_reference_files(original_inputs)
+        
+        # Outputs of steps finished by an earlier, checkpointed run
+        completed_steps = dict(completed_steps or {})
+        step_outputs = {}
+        step_results = []
+        running = {}
+        executed = set()
+        try:
+            while sorter.is_active():
+                for tool_name in sorter.get_ready():
+                    step_number = step_numbers[tool_name]
+                    # Reuse a checkpointed step only while its outputs exist and its inputs weren't regenerated
+                    if (tool_name in completed_steps
+                            and executed.isdisjoint(graph[tool_name])
+                            and all(os.path.exists(f) for f in completed_steps[tool_name])):
+                        step_outputs[tool_name] = completed_steps[tool_name]
+                        sorter.done(tool_name)
+                        workflow_logger.log_step_progress(step_number, tool_name, "Completed before checkpoint, skipping.")
+                        continue
+                    dependencies = graph[tool_name]
+                    if dependencies:
+                        produced = [f for dependency in dependencies for f in step_outputs[dependency]]
+                        current_inputs = self._filter_files_for_tool(produced, tool_name)
+                        tool_inputs = self._prepare_universal_inputs(
+                            tool_name, current_inputs, original_inputs, reference_files, step_number
+                        )
+                    else:
+                        current_inputs = tool_inputs = original_inputs
                     
-                workflow["status"] = status
-                workflow["execution_time"] = execution_time
-                workflow["completed_at"] = datetime.now().isoformat()
+                    workflow_logger.log_step_progress(step_number, tool_name, 
+                        f"Dependencies satisfied. Starting {tool_name} with {len(tool_inputs)} input files.")
+                    future = self._executor.submit(
+                        self._execute_workflow_step, run_id, step_number, tool_name,
+                        tool_inputs, current_inputs, workflow_config, workflow_logger
+                    )
+                    running[future] = tool_name
+                    executed.add(tool_name)
                 
-                with open(workflow_file, 'w') as f:
-                    yaml.dump(workflow, f, default_flow_style=False)
-                    
+                if not running:
+                    # Only checkpointed steps became ready; fetch their dependents
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                # Steps finishing in the same wakeup share one checkpoint event
+                finished = {}
+                try:
+                    for future in done:
+                        tool_name = running.pop(future)
+                        # A failed step raises here; steps already running are awaited below
+                        step_result = future.result()
+                        step_results.append(step_result)
+                        step_outputs[tool_name] = step_result['result'].output_files
+                        # Cache hits stay checkpointed here: re-running one on resume would also re-run its dependents
+                        if self._is_step_checkpointed(workflow_config, tool_name):
+                            finished[tool_name] = step_outputs[tool_name]
+                        sorter.done(tool_name)
+                finally:
+                    if finished:
+                        # Only the newly finished steps; the log replay merges earlier ones back in
+                        self._checkpoint(run_id, {'completed_steps': finished})
+        finally:
+            # Don't leave sibling steps running against the workflow's pooled containers
+            wait(running)
+        
+        return sorted(step_results, key=lambda step_result: step_result['step_number'])
+    
+    def _finish_failed_workflow_step(self, run_id: str, workflow_logger: DynamicWorkflowLogger, start_time: float):
+        """Record workflow completion after a step failure"""
+        workflow_logger.log_workflow_completion(False, time.perf_counter() - start_time)
+        
+        # Save enhanced issues analysis for failed workflow
+        run_dir = self.runs_dir / run_id
+        workflow_logger.save_enhanced_issues_log(run_id, run_dir)
+        
+        workflow_logger.cleanup()
+    
+    def _update_workflow_status(self, run_id: str, status: str, execution_time: float):
+        """Update workflow status in the workflow file"""
+        try:
+            workflow = self._load_workflow_file(run_id)
+            
+            workflow["status"] = status
+            workflow["execution_time"] = execution_time
+            workflow["completed_at"] = datetime.now().isoformat()
+            
+            self._save_workflow_file(run_id, workflow)
+            
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error(f"Failed to update workflow status: {e}")
             
     def get_workflow_status(self, run_id: str) -> Dict[str, Any]:
         """Get the current status of a workflow"""
         try:
-            workflow_file = self.runs_dir / run_id / "workflow.yaml"
-            if not workflow_file.exists():
+            try:
+                workflow = self._load_workflow_file(run_id)
+            except FileNotFoundError:
                 return {"error": "Workflow not found"}
                 
-            with open(workflow_file, 'r') as f:
-                workflow = yaml.safe_load(f)
-                
-            # Add additional status information
+            # Add additional status information; the run directory holds the workflow file
             run_dir = self.runs_dir / run_id
-            if run_dir.exists():
-                workflow["output_files"] = self._get_output_files(run_dir)
-                workflow["logs"] = self._get_log_files(run_dir)
+            workflow["output_files"] = self._get_output_files(run_dir)
+            workflow["logs"] = self._get_log_files(run_dir)
                 
             return workflow
             
@@ -1679,9 +2666,30 @@ class WorkflowOrchestrator:
         """Get list of output files from run directory"""
         output_files = []
         try:
-            for file_path in run_dir.rglob("*"):
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    output_files.append(str(file_path.relative_to(run_dir)))
+            # scandir entries carry their file type, so no extra stat per entry
+            root = str(run_dir)
+            stack = [root]
+            while stack:
+                directory = stack.pop()
+                # Tool output subdirectories may have their own logs/; only the run's top-level one is skipped
+                skip_dirs = OUTPUT_SCAN_SKIP_DIRS
+                if directory == root:
+                    skip_dirs = skip_dirs | OUTPUT_SCAN_SKIP_ROOT_DIRS
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            # Prune whole subtrees without reading their entries
+                            if entry.name not in skip_dirs:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if directory == root and (
+                                entry.name in OUTPUT_SCAN_SKIP_ROOT_FILES
+                                or (entry.name.startswith(OUTPUT_SCAN_SKIP_ROOT_TMP_PREFIXES) and entry.name.endswith(".tmp"))
+                            ):
+                                continue
+                            output_files.append(os.path.relpath(entry.path, root))
         except Exception as e:
             self.logger.error(f"Failed to get output files: {e}")
         return output_files
@@ -1690,11 +2698,12 @@ class WorkflowOrchestrator:
         """Get list of log files from run directory"""
         log_files = []
         try:
-            logs_dir = run_dir / "logs"
-            if logs_dir.exists():
-                for file_path in logs_dir.glob("*"):
-                    if file_path.is_file():
-                        log_files.append(str(file_path.relative_to(run_dir)))
+            with os.scandir(run_dir / "logs") as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        log_files.append(f"logs/{entry.name}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error(f"Failed to get log files: {e}")
         return log_files
@@ -1703,16 +2712,34 @@ class WorkflowOrchestrator:
         """List all available workflows"""
         workflows = []
         try:
-            for run_dir in self.runs_dir.iterdir():
-                if run_dir.is_dir():
-                    workflow_file = run_dir / "workflow.yaml"
-                    if workflow_file.exists():
-                        with open(workflow_file, 'r') as f:
-                            workflow = yaml.safe_load(f)
-                            workflows.append(workflow)
+            runs_mtime = os.stat(self._runs_dir_str).st_mtime_ns
+            cached = self._run_ids_cache
+            if cached is None or cached[0] != runs_mtime:
+                with os.scandir(self._runs_dir_str) as entries:
+                    cached = (runs_mtime, [entry.name for entry in entries if entry.is_dir()])
+                self._run_ids_cache = cached
+            run_ids = cached[1]
+            
+            # Overlap file I/O latency and YAML parsing across runs
+            for workflow in self._list_executor.map(self._load_workflow_file_if_present, run_ids):
+                if workflow is not None:
+                    workflows.append(workflow)
         except Exception as e:
             self.logger.error(f"Failed to list workflows: {e}")
         return workflows
+    
+    def _load_workflow_file_if_present(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Load a run's workflow.yaml, or None for run directories without one"""
+        expiry = self._missing_workflows.get(run_id)
+        if expiry is not None and time.monotonic() < expiry:
+            return None
+        try:
+            workflow = self._load_workflow_file(run_id)
+        except FileNotFoundError:
+            self._missing_workflows[run_id] = time.monotonic() + MISSING_WORKFLOW_TTL
+            return None
+        self._missing_workflows.pop(run_id, None)
+        return workflow
         
     def delete_workflow(self, run_id: str) -> bool:
         """Delete a workflow and all its data"""
@@ -1720,6 +2747,10 @@ class WorkflowOrchestrator:
             run_dir = self.runs_dir / run_id
             if run_dir.exists():
                 shutil.rmtree(run_dir)
+                self._wf_cache.pop(run_id, None)
+                self._missing_workflows.pop(run_id, None)
+                with self._workflow_db_lock:
+                    self._workflow_db.execute("DELETE FROM workflows WHERE run_id = ?", (run_id,))
                 self.logger.info(f"✅ Deleted workflow: {run_id}")
                 return True
             else:
@@ -1734,35 +2765,20 @@ class WorkflowOrchestrator:
         try:
             run_dir = self.runs_dir / run_id
             step_results_dir = run_dir / "step_results"
-            step_results_dir.mkdir(exist_ok=True)
             
             step_file = step_results_dir / f"step_{step_result['step_number']}_{step_result['tool_name']}.json"
             
-            # Convert ContainerExecutionResult to dict for JSON serialization
-            result_dict = {
-                'success': step_result['result'].success,
-                'output_files': step_result['result'].output_files,
-                'error_message': step_result['result'].error_message,
-                'execution_time': step_result['result'].execution_time,
-                'container_id': step_result['result'].container_id,
-                'container_name': step_result['result'].container_name,
-                'stdout': step_result['result'].stdout,
-                'stderr': step_result['result'].stderr,
-                'exit_code': step_result['result'].exit_code,
-                'timestamp': step_result['result'].timestamp
-            }
-            
+            # orjson serializes the ContainerExecutionResult dataclass natively, every field included
             step_data = {
                 'step_number': step_result['step_number'],
                 'tool_name': step_result['tool_name'],
                 'input_files': step_result['input_files'],
                 'output_dir': step_result['output_dir'],
-                'result': result_dict,
-                'timestamp': step_result['timestamp']
+                'result': step_result['result'],
+                'timestamp': iso_from_ns(step_result['timestamp_ns'])
             }
             
-            with open(step_file, 'w') as f:
-                json.dump(step_data, f, indent=2, default=str)
+            write_json_file(step_file, step_data)
                 
         except Exception as e:
             self.logger.error(f"Failed to save step result: {e}")
@@ -1786,8 +2802,7 @@ class WorkflowOrchestrator:
             # Save rerun information
             run_dir = self.runs_dir / run_id
             rerun_file = run_dir / f"rerun_info_step_{step_number}.json"
-            with open(rerun_file, 'w') as f:
-                json.dump(rerun_info, f, indent=2, default=str)
+            write_json_file(rerun_file, rerun_info)
             
             # Log rerun instructions
             workflow_logger.log_step_progress(step_number, tool_name, 
@@ -1807,12 +2822,15 @@ class WorkflowOrchestrator:
             run_dir = self.runs_dir / run_id
             summary_file = run_dir / "workflow_execution_summary.json"
             
+            # Tally step outcomes in a single pass
+            outcomes = Counter(r['result'].success for r in step_results)
+            
             summary = {
                 'workflow_id': run_id,
                 'total_execution_time': total_time,
                 'total_steps': len(step_results),
-                'completed_steps': len([r for r in step_results if r['result'].success]),
-                'failed_steps': len([r for r in step_results if not r['result'].success]),
+                'completed_steps': outcomes[True],
+                'failed_steps': outcomes[False],
                 'step_results': step_results,
                 'execution_timestamp': datetime.now().isoformat(),
                 'container_manager_status': {
@@ -1821,8 +2839,7 @@ class WorkflowOrchestrator:
                 }
             }
             
-            with open(summary_file, 'w') as f:
-                json.dump(summary, f, indent=2, default=str)
+            write_json_file(summary_file, summary)
                 
             self.logger.info(f"📊 Workflow execution summary saved to: {summary_file}")
             
@@ -1831,6 +2848,23 @@ class WorkflowOrchestrator:
     
     def rerun_failed_step(self, run_id: str, step_number: int) -> bool:
         """Rerun a specific failed step"""
+        return self.rerun_failed_steps(run_id, [step_number])[step_number]
+    
+    def rerun_failed_steps(self, run_id: str, step_numbers: List[int]) -> Dict[int, bool]:
+        """Rerun several failed steps concurrently on the shared step executor"""
+        results = {}
+        self.container_manager.acquire_pool(run_id)
+        try:
+            futures = {self._executor.submit(self._rerun_step, run_id, n): n for n in step_numbers}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        finally:
+            # Removes the pool only if no workflow run of this run_id is still using it
+            self.container_manager.release_pool(run_id)
+        return results
+    
+    def _rerun_step(self, run_id: str, step_number: int) -> bool:
+        """Rerun one step from its saved step result"""
         try:
             run_dir = self.runs_dir / run_id
             step_results_dir = run_dir / "step_results"
@@ -1842,8 +2876,7 @@ class WorkflowOrchestrator:
                 return False
             
             step_file = step_files[0]
-            with open(step_file, 'r') as f:
-                step_data = json.load(f)
+            step_data = orjson.loads(step_file.read_bytes())
             
             # Extract step information
             tool_name = step_data['tool_name']
@@ -1897,9 +2930,7 @@ class WorkflowOrchestrator:
             }
             
             if summary_file.exists():
-                with open(summary_file, 'r') as f:
-                    summary = json.load(f)
-                status.update(summary)
+                status.update(orjson.loads(summary_file.read_bytes()))
             
             return status
             
@@ -1928,41 +2959,190 @@ class WorkflowOrchestrator:
         try:
             if hasattr(self, 'container_manager'):
                 self.container_manager.stop_monitoring()
+            if hasattr(self, 'issues_logger'):
+                self.issues_logger.close()
+            if hasattr(self, '_executor'):
+                self._executor.shutdown(wait=False)
+            if hasattr(self, '_pipeline_executor'):
+                self._pipeline_executor.shutdown(wait=False)
+            if hasattr(self, '_hash_executor'):
+                self._hash_executor.shutdown(wait=False)
+            if hasattr(self, '_list_executor'):
+                self._list_executor.shutdown(wait=False)
         except:
             pass
 
 
+# Console icons for IssuesLogger severities
+SEVERITY_ICONS = {
+    "CRITICAL": "💥",
+    "ERROR": "❌", 
+    "WARNING": "⚠️",
+    "INFO": "ℹ️"
+}
+
+# Severity ranks and the overall issues status each maximum rank maps to
+SEVERITY_RANK = {"WARNING": 1, "ERROR": 2, "CRITICAL": 3}
+ISSUES_STATUS_BY_RANK = {
+    0: "CLEAN",
+    1: "WARNINGS_DETECTED",
+    2: "ERRORS_DETECTED",
+    3: "CRITICAL_FAILURE"
+}
+
+# Section rules used in the issues log
+SEP_EQ = "=" * 80 + "\n"
+SEP_DASH = "-" * 40 + "\n"
+
+# Issues log header (filled with the generation time) and the complete log of a clean run
+ISSUES_LOG_HEADER = SEP_EQ + "WORKFLOW ISSUES & FAILURES LOG\n" + "Generated: %s\n" + SEP_EQ + "\n"
+CLEAN_ISSUES_LOG = ISSUES_LOG_HEADER + "✅ No issues detected - workflow completed successfully!\n\n"
+
+# Fixed header of each issue in the issues log: number, timestamp, type, severity, message
+ISSUE_TMPL = (
+    "ISSUE #%d\n" + SEP_DASH +
+    "Timestamp: %s\n"
+    "Type: %s\n"
+    "Severity: %s\n"
+    "Message: %s\n"
+)
+
+# Issues retained in memory; older ones are spilled to issues_overflow.jsonl
+ISSUES_MAX_RETAINED = 10_000
+
+
+# Issues logs are written off the caller's thread; exit waits for pending writes
+_issues_log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="issues-log")
+atexit.register(_issues_log_executor.shutdown, wait=True)
+
+
+def _write_issues_log(issues_log_file: Path, content: bytes, issues_jsonl: bytes):
+    """Write a rendered issues log and its JSON Lines twin (runs on the issues-log thread)"""
+    try:
+        # Pre-encoded bytes: a single write(2) with no text-layer encoding
+        issues_log_file.write_bytes(content)
+        issues_log_file.with_suffix(".jsonl").write_bytes(issues_jsonl)
+        logger.info("📝 Issues log saved to: %s", issues_log_file)
+    except Exception as e:
+        logger.exception("❌ Failed to save issues log: %s", e)
+
+
+def format_issues_log_pretty(issues, spilled: int = 0, overflow_file: Optional[Path] = None) -> str:
+    """Render issues as the human-readable workflow_issues.log text"""
+    generated = datetime.now().isoformat()
+    
+    # Common success path: the whole log is a pre-baked constant
+    if not issues:
+        return CLEAN_ISSUES_LOG % generated
+    
+    parts = [
+        ISSUES_LOG_HEADER % generated,
+        f"🚨 {len(issues)} issues detected during workflow execution:\n\n"
+    ]
+    if spilled:
+        parts.append(f"📦 {spilled} older issues spilled to: {overflow_file}\n\n")
+    
+    for i, issue in enumerate(issues, 1):
+        parts.append(ISSUE_TMPL % (i, issue.timestamp, issue.issue_type, issue.severity, issue.message))
+        
+        if issue.details:
+            parts.append("Details:\n")
+            parts.extend(f"  {key}: {value}\n" for key, value in issue.details.items())
+            
+        if issue.stack_trace:
+            parts.append(f"Stack Trace:\n{issue.stack_trace}\n")
+            
+        parts.append("\n")
+    
+    return "".join(parts)
+
+
+@lru_cache(maxsize=ISSUES_MAX_RETAINED)
+def _issue_timestamp(ts_ns: int) -> str:
+    """Millisecond ISO 8601 string for an issue's clock reading, formatted once across repeated log saves"""
+    return iso_from_ns(ts_ns, timespec='milliseconds')
+
+
+@dataclass(slots=True)
+class Issue:
+    """A single workflow issue recorded by IssuesLogger"""
+    workflow_id: str
+    issue_type: str
+    severity: str
+    message: str
+    details: Dict[str, Any]
+    stack_trace: Optional[str] = None
+    # Raw clock reading; only formatted when the issues log is written
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 time the issue was logged, to the millisecond"""
+        return _issue_timestamp(self.timestamp_ns)
+
+
 class IssuesLogger:
     """Comprehensive logging system for workflow issues, failures, and diagnostics"""
     
-    def __init__(self):
-        self.issues = []
+    def __init__(self, overflow_file: Optional[Path] = None, max_issues: int = ISSUES_MAX_RETAINED):
+        self.issues = deque(maxlen=max_issues)
+        self.issues_high_water = 0
+        # Running tallies so summaries never rescan the issues
+        self._severity_counts = Counter()
+        self._issue_type_counts = Counter()
+        self._max_severity_rank = 0
+        self.overflow_file = overflow_file
+        self._overflow_handle = None
+        
+    def _spill_oldest_issue(self):
+        """Append the issue about to be evicted from the ring buffer to the overflow file"""
+        if self.overflow_file is None:
+            return
+        try:
+            if self._overflow_handle is None:
+                self.overflow_file.parent.mkdir(parents=True, exist_ok=True)
+                self._overflow_handle = open(self.overflow_file, 'ab', buffering=64 * 1024)
+            self._overflow_handle.write(orjson.dumps(self.issues[0], default=str) + b"\n")
+        except Exception as e:
+            logger.error("❌ Failed to spill issue to overflow log: %s", e)
+            self.overflow_file = None
+            
+    def close(self):
+        """Flush and close the overflow appender"""
+        if self._overflow_handle is not None:
+            try:
+                self._overflow_handle.close()
+            except Exception:
+                pass
+            self._overflow_handle = None
         
     def log_workflow_issue(self, workflow_id: str, issue_type: str, message: str, 
                           severity: str = "WARNING", details: Dict[str, Any] = None, 
                           stack_trace: str = None):
         """Log a workflow issue with comprehensive details"""
-        issue = {
-            "timestamp": datetime.now().isoformat(),
-            "workflow_id": workflow_id,
-            "issue_type": issue_type,
-            "severity": severity,
-            "message": message,
-            "details": details or {},
-            "stack_trace": stack_trace
-        }
+        # Severities and types come from a small closed set; interned keys hash and compare by identity
+        severity = sys.intern(severity)
+        issue_type = sys.intern(issue_type)
+        issue = Issue(
+            workflow_id=workflow_id,
+            issue_type=issue_type,
+            severity=severity,
+            message=message,
+            details=details or {},
+            stack_trace=stack_trace
+        )
         
+        if len(self.issues) == self.issues.maxlen:
+            self._spill_oldest_issue()
         self.issues.append(issue)
+        self.issues_high_water += 1
+        self._severity_counts[severity] += 1
+        self._issue_type_counts[issue_type] += 1
+        self._max_severity_rank = max(self._max_severity_rank, SEVERITY_RANK.get(severity, 0))
         
-        # Also log to console for immediate visibility
-        severity_icon = {
-            "CRITICAL": "💥",
-            "ERROR": "❌", 
-            "WARNING": "⚠️",
-            "INFO": "ℹ️"
-        }.get(severity, "❓")
-        
-        print(f"{severity_icon} WORKFLOW ISSUE [{severity}]: {issue_type} - {message}")
+        # Also log to console; stdout is flushed once when the issues log is saved
+        severity_icon = SEVERITY_ICONS.get(severity, "❓")
+        print(f"{severity_icon} WORKFLOW ISSUE [{severity}]: {issue_type} - {message}", flush=False)
         
     def log_tool_failure(self, workflow_id: str, tool_name: str, step_number: int, 
                          error_message: str, exit_code: int = None, 
@@ -2059,45 +3239,29 @@ class IssuesLogger:
             }
         )
         
-    def save_issues_log(self, workflow_id: str, run_dir: Path):
-        """Save all issues to a dedicated log file"""
+    def save_issues_log(self, workflow_id: str, run_dir: Path) -> Optional[Future]:
+        """Render all issues and save them to a dedicated log file in the background"""
         try:
-            issues_log_file = run_dir / "logs" / "workflow_issues.log"
-            issues_log_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(issues_log_file, 'w') as f:
-                f.write("=" * 80 + "\n")
-                f.write(f"WORKFLOW ISSUES & FAILURES LOG\n")
-                f.write(f"Generated: {datetime.now().isoformat()}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                if not self.issues:
-                    f.write("✅ No issues detected - workflow completed successfully!\n\n")
-                else:
-                    f.write(f"🚨 {len(self.issues)} issues detected during workflow execution:\n\n")
-                    
-                    for i, issue in enumerate(self.issues, 1):
-                        f.write(f"ISSUE #{i}\n")
-                        f.write("-" * 40 + "\n")
-                        f.write(f"Timestamp: {issue['timestamp']}\n")
-                        f.write(f"Type: {issue['issue_type']}\n")
-                        f.write(f"Severity: {issue['severity']}\n")
-                        f.write(f"Message: {issue['message']}\n")
-                        
-                        if issue['details']:
-                            f.write(f"Details:\n")
-                            for key, value in issue['details'].items():
-                                f.write(f"  {key}: {value}\n")
-                                
-                        if issue['stack_trace']:
-                            f.write(f"Stack Trace:\n{issue['stack_trace']}\n")
-                            
-                        f.write("\n")
-                        
-            print(f"📝 Issues log saved to: {issues_log_file}")
+            logs_dir = run_dir / "logs"
+            logs_dir.mkdir(parents=True, exist_ok=True)
+            issues_log_file = logs_dir / "workflow_issues.log"
+            
+            # Render on this thread; only the writes happen in the background
+            content = format_issues_log_pretty(
+                self.issues, self.issues_high_water - len(self.issues), self.overflow_file
+            ).encode("utf-8")
+            # Machine-readable copy: one orjson-serialized issue per line
+            issues_jsonl = b"".join(orjson.dumps(issue, default=str) + b"\n" for issue in self.issues)
+            return _issues_log_executor.submit(_write_issues_log, issues_log_file, content, issues_jsonl)
             
         except Exception as e:
-            print(f"❌ Failed to save issues log: {str(e)}")
+            logger.exception("❌ Failed to save issues log: %s", e)
+            return None
+        
+        finally:
+            if self._overflow_handle is not None:
+                self._overflow_handle.flush()
+            sys.stdout.flush()
             
     def get_issues_summary(self, workflow_id: str) -> Dict[str, Any]:
         """Get a summary of all issues for a workflow"""
@@ -2109,32 +3273,17 @@ class IssuesLogger:
                 "summary": "No issues detected"
             }
             
-        # Count issues by severity
-        severity_counts = {}
-        issue_types = {}
+        severity_counts = dict(self._severity_counts)
+        severity_parts = ["%d %s" % (count, severity) for severity, count in severity_counts.items()]
         
-        for issue in self.issues:
-            severity = issue['severity']
-            issue_type = issue['issue_type']
-            
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-            issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
-            
-        # Determine overall status
-        if any(issue['severity'] == 'CRITICAL' for issue in self.issues):
-            overall_status = "CRITICAL_FAILURE"
-        elif any(issue['severity'] == 'ERROR' for issue in self.issues):
-            overall_status = "ERRORS_DETECTED"
-        elif any(issue['severity'] == 'WARNING' for issue in self.issues):
-            overall_status = "WARNINGS_DETECTED"
-        else:
-            overall_status = "CLEAN"
-            
         return {
             "workflow_id": workflow_id,
-            "total_issues": len(self.issues),
-            "status": overall_status,
+            # Includes issues spilled to the overflow file
+            "total_issues": self.issues_high_water,
+            # Issues still held in the in-memory ring buffer
+            "recent_issues": len(self.issues),
+            "status": ISSUES_STATUS_BY_RANK[self._max_severity_rank],
             "severity_breakdown": severity_counts,
-            "issue_type_breakdown": issue_types,
-            "summary": f"Detected {len(self.issues)} issues: {', '.join(f'{count} {severity}' for severity, count in severity_counts.items())}"
+            "issue_type_breakdown": dict(self._issue_type_counts),
+            "summary": "Detected %d issues: %s" % (self.issues_high_water, ", ".join(severity_parts))
         }